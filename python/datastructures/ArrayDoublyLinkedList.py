@@ -0,0 +1,395 @@
+"""
+ArrayDoublyLinkedList Class
+@author Avinash Rai
+
+Doubly Linked List without node objects.
+Slot i of the list is values[i] plus two integer links, previous[i] and next[i],
+kept in typed array('l') buffers (-1 = no node). A removed slot is pushed on a
+free list threaded through one of the two buffers and reused by the next insert.
+About 24 bytes per element on 64-bit CPython (one list slot and two 8-byte links)
+against 56 bytes for a TwoPointerNode, and no per-element objects for the GC to track.
+reverse() is O(1): the two link buffers swap roles, as do head and tail.
+
+Same API as DoublyLinkedList, but there are no nodes to hand out:
+pop, popFirst, removeByIndex, removeByValue and getByIndex return the VALUE,
+and find returns the INDEX.
+
+Methods overview:
+    - append(value)
+    - prepend(value)
+    - insert(index, value)
+    - pop()
+    - popFirst()
+    - removeByIndex(index)
+    - removeByValue(value)
+    - getByIndex(index)
+    - setByIndex(index, value)
+    - find(value)
+    - print()
+    - length()
+    - isEmpty()
+    - reverse()
+    - clear()
+    - extend(iterable)
+    - ArrayDoublyLinkedList.fromIterable(iterable)
+    - len(list), list[index], list[start:stop:step]
+    - for value in list, reversed(list)
+"""
+from array import array
+from itertools import islice
+
+class ArrayDoublyLinkedList:
+    """
+    Create an instance of Array Doubly Linked List class
+        Initialize with a value or create an empty list
+    Private Members:-
+        - values Python list, one slot per element
+        - previous, next array('l') link buffers indexed by slot
+        - head, tail slot numbers, -1 when empty
+        - free first slot of the free list, -1 when there is none
+        - freeLinks the buffer the free list is threaded through; it stays the same
+          buffer when reverse() swaps previous and next
+        - length counter
+    """
+    def __init__(self, value=None)->None:
+        self.__values = []
+        self.__previous = array("l")
+        self.__next = array("l")
+        self.__freeLinks = self.__next
+        self.__head = -1
+        self.__tail = -1
+        self.__free = -1
+        self.__length = 0
+        if value:
+            self.append(value)
+
+    """
+    Private method - Stores a value in a free slot, or a new one at the end of the buffers.
+    @return int - the slot
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def __allocate(self, value):
+        slot = self.__free
+        if slot != -1:
+            self.__free = self.__freeLinks[slot]
+            self.__values[slot] = value
+            return slot
+        self.__values.append(value)
+        self.__previous.append(-1)
+        self.__next.append(-1)
+        return len(self.__values) - 1
+
+    """
+    Private method - Unlinks a slot, puts it on the free list and returns its value.
+    @return any
+    Complexity: O(1)
+    """
+    def __release(self, slot):
+        previous = self.__previous
+        links = self.__next
+        before = previous[slot]
+        after = links[slot]
+        if before == -1:
+            self.__head = after
+        else:
+            links[before] = after
+        if after == -1:
+            self.__tail = before
+        else:
+            previous[after] = before
+        values = self.__values
+        value = values[slot]
+        values[slot] = None
+        previous[slot] = -1
+        links[slot] = -1
+        self.__freeLinks[slot] = self.__free
+        self.__free = slot
+        self.__length -= 1
+        return value
+
+    """
+    Private method - Slot of the element at a given index, walked from the nearer end.
+    @return int
+    Complexity: T:O(n/2) S:O(1)
+    """
+    def __slotAt(self, index):
+        if index < self.__length // 2:
+            slot = self.__head
+            links = self.__next
+            for _ in range(index):
+                slot = links[slot]
+        else:
+            slot = self.__tail
+            links = self.__previous
+            for _ in range(self.__length - 1 - index):
+                slot = links[slot]
+        return slot
+
+    """
+    Adds a value at the end of the list.
+    @return Boolean
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def append(self, value:any)->bool:
+        slot = self.__allocate(value)
+        self.__previous[slot] = self.__tail
+        self.__next[slot] = -1
+        if self.__tail == -1:
+            self.__head = slot
+        else:
+            self.__next[self.__tail] = slot
+        self.__tail = slot
+        self.__length += 1
+        return True
+
+    """
+    Add a value at the beginning of the list.
+    @return Boolean
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def prepend(self, value:any)->bool:
+        slot = self.__allocate(value)
+        self.__previous[slot] = -1
+        self.__next[slot] = self.__head
+        if self.__head == -1:
+            self.__tail = slot
+        else:
+            self.__previous[self.__head] = slot
+        self.__head = slot
+        self.__length += 1
+        return True
+
+    """
+    Inserts a value so that it ends up at the given index (0 <= index <= length).
+    @return Boolean - False if the index is out of range
+    Complexity: T:O(n/2) S:O(1)
+    """
+    def insert(self, index:int, value:any)->bool:
+        if index < 0 or index > self.__length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self.__length:
+            return self.append(value)
+        after = self.__slotAt(index)
+        before = self.__previous[after]
+        slot = self.__allocate(value)
+        self.__previous[slot] = before
+        self.__next[slot] = after
+        self.__next[before] = slot
+        self.__previous[after] = slot
+        self.__length += 1
+        return True
+
+    """
+    Removes the last value from the list and return it.
+    @return any/None
+    Complexity: O(1)
+    """
+    def pop(self)->any:
+        if self.__length == 0:
+            return None
+        return self.__release(self.__tail)
+
+    """
+    Removes the first value and return it.
+    @return any/None
+    Complexity: O(1)
+    """
+    def popFirst(self)->any:
+        if self.__length == 0:
+            return None
+        return self.__release(self.__head)
+
+    """
+    Removes the value at a specific position and return it.
+    @return any/None
+    Complexity: T:O(n/2) S:O(1)
+    """
+    def removeByIndex(self, index:int)->any:
+        if index < 0 or index >= self.__length:
+            return None
+        return self.__release(self.__slotAt(index))
+
+    """
+    Search for a value and remove the first occurrence.
+    @return any/None - the removed value
+    Complexity: T:O(n) S:O(1)
+    """
+    def removeByValue(self, value:any)->any:
+        slot = self.__head
+        while slot != -1:
+            if self.__values[slot] == value:
+                return self.__release(slot)
+            slot = self.__next[slot]
+        return None
+
+    """
+    Returns the value at a given index.
+    @return any/None
+    Complexity: T:O(n/2) S:O(1)
+    """
+    def getByIndex(self, index:int)->any:
+        if index < 0 or index >= self.__length:
+            return None
+        return self.__values[self.__slotAt(index)]
+
+    """
+    Updates the value at a specific index.
+    @return bool - True if updated
+    Complexity: T:O(n/2) S:O(1)
+    """
+    def setByIndex(self, index:int, value:any)->bool:
+        if index < 0 or index >= self.__length:
+            return False
+        self.__values[self.__slotAt(index)] = value
+        return True
+
+    """
+    Returns the index of the first occurrence of the given value.
+    @return int/None
+    Complexity: T:O(n) S:O(1)
+    """
+    def find(self, value:any)->int:
+        index = 0
+        slot = self.__head
+        while slot != -1:
+            if self.__values[slot] == value:
+                return index
+            slot = self.__next[slot]
+            index += 1
+        return None
+
+    """
+    Print all items in the list
+    Complexity: T:O(n) S:O(1)
+    """
+    def print(self)->None:
+        for value in self:
+            print(value)
+
+    """
+    Length/size of the list
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        return self.__length
+
+    """
+    Checks if the list is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        if self.__length > 0:
+            return False
+        return True
+
+    """
+    Reverses the list by swapping the roles of the two link buffers.
+    @return Boolean - True if operation completed
+    Complexity: O(1)
+    """
+    def reverse(self)->bool:
+        if self.__length == 0:
+            return False
+        self.__previous, self.__next = self.__next, self.__previous
+        self.__head, self.__tail = self.__tail, self.__head
+        return True
+
+    """
+    Clears all items and releases the buffers
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        self.__values = []
+        self.__previous = array("l")
+        self.__next = array("l")
+        self.__freeLinks = self.__next
+        self.__head = -1
+        self.__tail = -1
+        self.__free = -1
+        self.__length = 0
+
+    """
+    Appends every value of an iterable (e.g. a generator) in a single pass.
+    @return int - number of values added
+    Complexity: T:O(k) S:O(1), where k = number of new values
+    """
+    def extend(self, iterable)->int:
+        if iterable is self:
+            iterable = list(self)
+        count = 0
+        for value in iterable:
+            self.append(value)
+            count += 1
+        return count
+
+    """
+    Builds a list from an iterable in a single pass.
+    @return ArrayDoublyLinkedList
+    Complexity: T:O(n) S:O(n)
+    """
+    @classmethod
+    def fromIterable(cls, iterable)->"ArrayDoublyLinkedList":
+        newList = cls()
+        newList.extend(iterable)
+        return newList
+
+    """
+    Supports "for value in list", head to tail.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        values = self.__values
+        links = self.__next
+        slot = self.__head
+        while slot != -1:
+            yield values[slot]
+            slot = links[slot]
+
+    """
+    Supports reversed(list), tail to head through the previous links.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __reversed__(self):
+        values = self.__values
+        links = self.__previous
+        slot = self.__tail
+        while slot != -1:
+            yield values[slot]
+            slot = links[slot]
+
+    """
+    Length of the list, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__length
+
+    """
+    Supports list[index] and list[start:stop:step].
+        An int index returns the value (negative indexes count from the tail) and
+        raises IndexError if out of range. A slice returns a new ArrayDoublyLinkedList.
+    @return any/ArrayDoublyLinkedList
+    Complexity: T:O(n/2) S:O(1) for an index, T:O(n) S:O(k) for a slice
+    """
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step > 0:
+                return ArrayDoublyLinkedList.fromIterable(islice(self, start, max(start, stop), step))
+            last = self.__length - 1
+            return ArrayDoublyLinkedList.fromIterable(islice(reversed(self), last - start, max(last - start, last - stop), -step))
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers or slices")
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("list index out of range")
+        return self.__values[self.__slotAt(index)]
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+ArrayNode Class
+@author Avinash Rai
+
+Node holding a small Python list of values and a NEXT pointer.
+Used by UnrolledLinkedList.
+Only the node is slotted: most of its memory is the values list it owns.
+"""
+
+class ArrayNode:
+    __slots__ = ("values", "next")
+
+    def __init__(self, values:list=None)->None:
+        self.values = values if values is not None else []
+        self.next = None
\ No newline at end of file
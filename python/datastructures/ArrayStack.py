@@ -0,0 +1,130 @@
+"""
+ArrayStack Class
+@author Avinash Rai
+
+LIFO (Last in First Out)
+Unlimited size Stack over a contiguous Python list instead of linked Nodes.
+The top of the stack is the end of the list, so push and pop are amortised O(1)
+list appends and pops, and nothing is allocated per element.
+pop returns the VALUE. pushMany and popMany move a batch in one call.
+
+Methods overview:
+    - push(value)
+    - pushMany(iterable)
+    - peek()
+    - pop()
+    - popMany(n)
+    - print()
+    - size()
+    - isEmpty()
+    - clear()
+    - len(stack)
+"""
+
+class ArrayStack:
+    """
+    Create an instance of ArrayStack class
+        Initialize with a value or create an empty stack.
+
+    Private Members:-
+        - items (list): Values from bottom to top
+    """
+    def __init__(self, value=None)->None:
+        self.__items = []
+        if value:
+            self.__items.append(value)
+
+    """
+    Adds a value at the top of the stack.
+    @return Boolean - True when successful
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def push(self, value:any)->bool:
+        self.__items.append(value)
+        return True
+
+    """
+    Pushes every value of an iterable, the last one ends up on top.
+    @return int - number of values pushed
+    Complexity: T:O(k) S:O(1), where k = number of new values
+    """
+    def pushMany(self, iterable)->int:
+        before = len(self.__items)
+        self.__items.extend(iterable)
+        return len(self.__items) - before
+
+    """
+    View the top value of the stack without removing it.
+    @return any
+    Complexity: O(1)
+    """
+    def peek(self)->any:
+        if self.__items:
+            return self.__items[-1]
+        return None
+
+    """
+    Removes the top value from the stack and return it.
+    @return any/None
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def pop(self)->any:
+        if self.__items:
+            return self.__items.pop()
+        return None
+
+    """
+    Removes up to n values from the top of the stack.
+    @return list - the removed values, top first
+    Complexity: T:O(n) S:O(n)
+    """
+    def popMany(self, n:int)->list:
+        if n <= 0 or not self.__items:
+            return []
+        values = self.__items[-n:]
+        del self.__items[-n:]
+        values.reverse()
+        return values
+
+    """
+    Print the contents of the stack from top to bottom.
+    @return None
+    Complexity: T:O(n) S:O(1)
+    """
+    def print(self)->None:
+        for value in reversed(self.__items):
+            print(value)
+
+    """
+    Size/height of the stack
+    @return int
+    Complexity: O(1)
+    """
+    def size(self)->int:
+        return len(self.__items)
+
+    """
+    Checks if the stack is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        if self.__items:
+            return False
+        return True
+
+    """
+    Clears all items in the stack
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        self.__items = []
+
+    """
+    Size of the stack, same as size().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return len(self.__items)
\ No newline at end of file
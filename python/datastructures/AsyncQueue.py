@@ -0,0 +1,224 @@
+"""
+AsyncQueue Class
+@author Avinash Rai
+
+FIFO (First in First Out) for asyncio tasks, with an optional capacity bound.
+await get() waits for a value and await put() waits for room (back-pressure).
+Waiting tasks are served strictly in arrival order: put() hands its value straight
+to the longest waiting get(), and get() moves the value of the longest waiting put()
+into the freed slot, so a task that arrives later can never overtake a waiter.
+getNowait() and putNowait() never wait and never yield to the event loop; neither
+do get() and put() when they can complete at once.
+Values live in a RingBufferQueue; AsyncStack uses an ArrayStack instead.
+Not thread-safe: use it from the event loop's thread only.
+
+Methods overview:
+    - await put(value)
+    - await get()
+    - putNowait(value)
+    - getNowait()
+    - front()
+    - length()
+    - capacity()
+    - isEmpty()
+    - isFull()
+    - clear()
+    - len(queue)
+"""
+import asyncio
+from collections import deque
+from datastructures.ArrayStack import ArrayStack
+from datastructures.RingBufferQueue import RingBufferQueue
+
+class AsyncQueue:
+    """
+    Create an instance of AsyncQueue class
+        capacity Max number of values, None for an unbounded queue
+        lifo Store values in an ArrayStack (used by AsyncStack)
+
+    Private Members:
+        - __add, __take, __peek, __count Bound methods of the value store
+        - __giveBack Bound method that puts a value back where __take takes values from
+        - __capacity (int): Bound on the number of values or None
+        - __getters (deque): Futures of the waiting get() calls, oldest first
+        - __putters (deque): (future, value) of the waiting put() calls, oldest first
+    """
+    def __init__(self, capacity:int=None, lifo:bool=False)->None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if lifo:
+            items = ArrayStack()
+            self.__add, self.__take, self.__peek, self.__count = items.push, items.pop, items.peek, items.size
+            self.__giveBack = items.push
+        else:
+            items = RingBufferQueue()
+            self.__add, self.__take, self.__peek, self.__count = items.enqueue, items.dequeue, items.front, items.length
+            self.__giveBack = items.enqueueFront
+        self.__clear = items.clear
+        self.__capacity = capacity
+        self.__getters = deque()
+        self.__putters = deque()
+
+    """
+    Private method - Moves the values of waiting put() calls in while there is room.
+        Entries of put() calls cancelled in the meantime are dropped.
+    @return None
+    Complexity: O(1) per admitted value
+    """
+    def __admitPutters(self):
+        putters = self.__putters
+        while putters and (self.__capacity is None or self.__count() < self.__capacity):
+            future, value = putters.popleft()
+            if not future.done():
+                self.__add(value)
+                future.set_result(True)
+
+    """
+    Private method - Takes a waiter out of a line after its task was cancelled.
+    @return None
+    Complexity: T:O(w) S:O(1), w = number of waiters
+    """
+    def __forget(self, waiters, entry):
+        try:
+            waiters.remove(entry)
+        except ValueError:
+            pass
+
+    """
+    Private method - Hands a value to the longest waiting get() that is still live.
+    @return Boolean - False if no get() is waiting
+    Complexity: O(1) per skipped cancelled waiter
+    """
+    def __handToGetter(self, value):
+        getters = self.__getters
+        while getters:
+            getter = getters.popleft()
+            if not getter.done():
+                getter.set_result(value)
+                return True
+        return False
+
+    """
+    Adds a value without waiting: it goes to the longest waiting get() if there is one.
+    @return Boolean - False if the queue is full or older put() calls are still waiting
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def putNowait(self, value:any)->bool:
+        if self.__handToGetter(value):
+            return True
+        if self.__putters or (self.__capacity is not None and self.__count() >= self.__capacity):
+            return False
+        self.__add(value)
+        return True
+
+    """
+    Removes the next value without waiting.
+    @return any/None - None if the queue is empty
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def getNowait(self)->any:
+        if self.__count() == 0:
+            return None
+        value = self.__take()
+        if self.__putters:
+            self.__admitPutters()
+        return value
+
+    """
+    Adds a value, waiting for room while the queue is full.
+        If the task is cancelled while still waiting, the value is not added; if the
+        value was already admitted when the cancellation arrives, it stays in the queue.
+    @return Boolean - True
+    Complexity: T:O(1) amortized S:O(1), plus the wait
+    """
+    async def put(self, value:any)->bool:
+        if self.putNowait(value):
+            return True
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, value)
+        self.__putters.append(entry)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                self.__forget(self.__putters, entry)
+            raise
+
+    """
+    Removes the next value, waiting for one while the queue is empty.
+        If the task is cancelled after a value was handed to it, the value goes to the
+        next waiting get(), or back to the front of the queue (of AsyncStack: the top),
+        even if that puts the queue one over its capacity.
+    @return any
+    Complexity: T:O(1) amortized S:O(1), plus the wait
+    """
+    async def get(self)->any:
+        if self.__count() > 0:
+            return self.getNowait()
+        future = asyncio.get_running_loop().create_future()
+        self.__getters.append(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                self.__forget(self.__getters, future)
+            elif not self.__handToGetter(future.result()):
+                self.__giveBack(future.result())
+            raise
+
+    """
+    View the value get() would return next, without removing it.
+    @return any/None
+    Complexity: O(1)
+    """
+    def front(self)->any:
+        return self.__peek()
+
+    """
+    Returns the number of values stored, waiting put() calls not included.
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        return self.__count()
+
+    """
+    Returns the capacity bound.
+    @return int/None - None if unbounded
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return self.__capacity
+
+    """
+    Checks if the queue is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        return self.__count() == 0
+
+    """
+    Checks if the queue holds capacity values.
+    @return boolean - always False if unbounded
+    Complexity: O(1)
+    """
+    def isFull(self)->bool:
+        return self.__capacity is not None and self.__count() >= self.__capacity
+
+    """
+    Clears all values, then lets waiting put() calls in while there is room.
+    @return None
+    Complexity: O(1) plus O(1) per admitted value
+    """
+    def clear(self)->None:
+        self.__clear()
+        self.__admitPutters()
+
+    """
+    Length of the queue, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__count()
\ No newline at end of file
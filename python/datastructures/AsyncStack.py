@@ -0,0 +1,39 @@
+"""
+AsyncStack Class
+@author Avinash Rai
+
+LIFO (Last in First Out) for asyncio tasks, with an optional capacity bound.
+Same API and waiting rules as AsyncQueue: get() returns the most recently put value,
+but waiting get() and put() calls are still served in arrival order (FIFO).
+Values live in an ArrayStack.
+
+Methods overview:
+    - await put(value)
+    - await get()
+    - putNowait(value)
+    - getNowait()
+    - peek()
+    - length()
+    - capacity()
+    - isEmpty()
+    - isFull()
+    - clear()
+    - len(stack)
+"""
+from datastructures.AsyncQueue import AsyncQueue
+
+class AsyncStack(AsyncQueue):
+    """
+    Create an instance of AsyncStack class
+        capacity Max number of values, None for an unbounded stack
+    """
+    def __init__(self, capacity:int=None)->None:
+        super().__init__(capacity, lifo=True)
+
+    """
+    View the top value of the stack without removing it.
+    @return any/None
+    Complexity: O(1)
+    """
+    def peek(self)->any:
+        return self.front()
\ No newline at end of file
@@ -19,7 +19,7 @@ Methods overview:
     - isBalanced()
 """
 from datastructures.LeftRightNode import LeftRightNode
-from datastructures.Stack import Stack
+from datastructures.ArrayStack import ArrayStack
 
 class BinarySearchTree:
     """
@@ -154,7 +154,7 @@ class BinarySearchTree:
 
     """
     Returns the maximum depth of the tree
-        Utilises the Stack class
+        Utilises the ArrayStack class
     @return int
     Complexity: O(n)
     """
@@ -163,15 +163,14 @@ class BinarySearchTree:
             return 0
         
         max_depth = 0
-        stack = Stack()
+        stack = ArrayStack()
         stack.push((self.__root, 1))
 
         while not stack.isEmpty():
-            node, level = stack.pop().value
+            node, level = stack.pop()
             if node is not None:
                 max_depth = max(max_depth, level)
-                stack.push((node.left, level + 1))
-                stack.push((node.right, level + 1))
+                stack.pushMany(((node.left, level + 1), (node.right, level + 1)))
         
         return max_depth              
 
@@ -213,6 +212,7 @@ class BinarySearchTree:
 
     """
     Checks if the tree is balanced
+        Utilises the ArrayStack class
     @return boolean
     Complexity: O(n)
     """
@@ -220,19 +220,17 @@ class BinarySearchTree:
         if self.__root is None:
             return True
 
-        stack = Stack()
+        stack = ArrayStack()
         stack.push((self.__root, False))
         depths = {}
 
         while not stack.isEmpty():
-            node, visited = stack.pop().value
+            node, visited = stack.pop()
             if node is None:
                 continue
 
             if not visited:
-                stack.push((node, True))
-                stack.push((node.right, False))
-                stack.push((node.left, False))
+                stack.pushMany(((node, True), (node.right, False), (node.left, False)))
             else:
                 left = depths.get(node.left, 0)
                 right = depths.get(node.right, 0)
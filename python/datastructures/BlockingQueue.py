@@ -0,0 +1,193 @@
+"""
+BlockingQueue Class
+@author Avinash Rai
+
+Thread-safe FIFO (First in First Out) for producer and consumer threads.
+Values live in a RingBufferQueue guarded by one threading.Lock. Two Conditions on
+that lock, notEmpty and notFull, let get() wait for a value and put() wait for room
+when the queue has a capacity bound, each with an optional timeout.
+getBatch(maxItems) drains up to maxItems values under a single lock acquisition,
+so a consumer that can work in batches takes the lock once instead of once per value.
+get() returns None on timeout, so None should not be put in the queue.
+
+Methods overview:
+    - put(value, block, timeout)
+    - get(block, timeout)
+    - getBatch(maxItems, timeout)
+    - enqueue(value)
+    - dequeue()
+    - front()
+    - length()
+    - capacity()
+    - isEmpty()
+    - isFull()
+    - clear()
+    - len(queue)
+"""
+import threading
+from datastructures.RingBufferQueue import RingBufferQueue
+
+class BlockingQueue:
+    """
+    Create an instance of BlockingQueue class
+        capacity Max number of values, None for an unbounded queue
+
+    Private Members:
+        - __items (RingBufferQueue): The values, front first
+        - __capacity (int): Bound on the number of values or None
+        - __lock (threading.Lock): Guards every access to items
+        - __notEmpty (threading.Condition): Signalled when a value is added
+        - __notFull (threading.Condition): Signalled when values are removed
+    """
+    def __init__(self, capacity:int=None)->None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.__items = RingBufferQueue()
+        self.__capacity = capacity
+        self.__lock = threading.Lock()
+        self.__notEmpty = threading.Condition(self.__lock)
+        self.__notFull = threading.Condition(self.__lock)
+
+    """
+    Private method - Wait predicate, True if a value can be removed. Lock must be held.
+    @return Boolean
+    Complexity: O(1)
+    """
+    def __hasItems(self):
+        return self.__items.length() > 0
+
+    """
+    Private method - Wait predicate, True if a value can be added. Lock must be held.
+    @return Boolean
+    Complexity: O(1)
+    """
+    def __hasRoom(self):
+        return self.__capacity is None or self.__items.length() < self.__capacity
+
+    """
+    Adds a value to the rear of the queue.
+        If the queue is full, waits for room: forever when timeout is None, at most
+        timeout seconds otherwise. With block=False it returns at once.
+    @return Boolean - False if the queue stayed full
+    Complexity: T:O(1) amortized S:O(1), plus the wait
+    """
+    def put(self, value:any, block:bool=True, timeout:float=None)->bool:
+        with self.__lock:
+            if not self.__hasRoom():
+                if not block or not self.__notFull.wait_for(self.__hasRoom, timeout):
+                    return False
+            self.__items.enqueue(value)
+            self.__notEmpty.notify()
+            return True
+
+    """
+    Removes the front value from the queue and returns it.
+        If the queue is empty, waits for a value: forever when timeout is None, at
+        most timeout seconds otherwise. With block=False it returns at once.
+    @return any/None - None if the queue stayed empty
+    Complexity: T:O(1) amortized S:O(1), plus the wait
+    """
+    def get(self, block:bool=True, timeout:float=None)->any:
+        with self.__lock:
+            if self.__items.length() == 0:
+                if not block or not self.__notEmpty.wait_for(self.__hasItems, timeout):
+                    return None
+            value = self.__items.dequeue()
+            self.__notFull.notify()
+            return value
+
+    """
+    Removes up to maxItems values from the front of the queue under one lock acquisition.
+        Waits like get() until at least one value is there; timeout=0 never waits.
+    @return list - the values, front first, empty if the queue stayed empty
+    Complexity: T:O(k) S:O(k), k = number of values returned
+    """
+    def getBatch(self, maxItems:int, timeout:float=None)->list:
+        if maxItems < 1:
+            return []
+        with self.__lock:
+            if self.__items.length() == 0:
+                if not self.__notEmpty.wait_for(self.__hasItems, timeout):
+                    return []
+            dequeue = self.__items.dequeue
+            values = [dequeue() for _ in range(min(maxItems, self.__items.length()))]
+            self.__notFull.notify(len(values))
+            return values
+
+    """
+    Adds a value to the rear of the queue without waiting, same as put(value, False).
+    @return Boolean - False if the queue is full
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def enqueue(self, value:any)->bool:
+        return self.put(value, False)
+
+    """
+    Removes the front value without waiting, same as get(False).
+    @return any/None
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def dequeue(self)->any:
+        return self.get(False)
+
+    """
+    View the first value of the queue without removing it.
+    @return any
+    Complexity: O(1)
+    """
+    def front(self)->any:
+        with self.__lock:
+            return self.__items.front()
+
+    """
+    Returns the number of values in the queue.
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        with self.__lock:
+            return self.__items.length()
+
+    """
+    Returns the capacity bound.
+    @return int/None - None if unbounded
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return self.__capacity
+
+    """
+    Checks if the queue is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        with self.__lock:
+            return self.__items.isEmpty()
+
+    """
+    Checks if the queue holds capacity values.
+    @return boolean - always False if unbounded
+    Complexity: O(1)
+    """
+    def isFull(self)->bool:
+        with self.__lock:
+            return not self.__hasRoom()
+
+    """
+    Clears all values and wakes up every producer waiting for room.
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        with self.__lock:
+            self.__items.clear()
+            self.__notFull.notify_all()
+
+    """
+    Length of the queue, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.length()
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+ConcurrentHashTable Class
+@author Avinash Rai
+
+Thread-safe HashTable using "Lock Striping".
+Keys are split over a fixed number of segments, each one an independent HashTable
+guarded by its own lock, so threads working on different segments never wait for
+each other. Every operation on a key takes only the lock of that key's segment.
+Reads lock too: HashTable.getItem() migrates buckets during an incremental resize.
+
+The segment is picked with Fibonacci hashing (multiply, keep the high bits) so the
+keys of one segment still spread over all of that segment's buckets.
+
+Methods overview:
+    - setItem(key,value)
+    - getItem(key)
+    - keys()
+    - remove(key)
+    - keyExists(key)
+    - capacity()
+    - numItems()
+    - isEmpty()
+    - clear()
+    - len(table), key in table, for key in table
+"""
+import threading
+from datastructures.HashTable import HashTable
+
+class ConcurrentHashTable:
+    """
+    Creates a thread-safe hash table split into lock-guarded segments.
+        Segment count is rounded up to a power of two.
+    Private Members:-
+        - segments List of HashTable
+        - locks One threading.Lock per segment
+        - shift 64 - log2(segment count), selects the high bits of the mixed hash
+        - hashFunction Callable key -> int used to pick the segment
+    """
+    def __init__(self, segments=16, size=10, loadFactor=0.75, hashFunction=hash)->None:
+        if segments < 1:
+            raise ValueError("segments must be at least 1")
+        bits = 0
+        while (1 << bits) < segments:
+            bits += 1
+        self.__segments = [HashTable(size, loadFactor, hashFunction) for _ in range(1 << bits)]
+        self.__locks = [threading.Lock() for _ in range(1 << bits)]
+        self.__shift = 64 - bits
+        self.__hashFunction = hashFunction
+
+    """
+    Private method - Index of the segment responsible for the key.
+    @return int
+    Complexity: O(1)
+    """
+    def __segmentOf(self, key):
+        if self.__shift == 64:
+            return 0
+        return ((self.__hashFunction(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self.__shift
+
+    """
+    Inserts or updates a key-value pair.
+    @return Bool
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def setItem(self, key:any, value:any)->bool:
+        i = self.__segmentOf(key)
+        with self.__locks[i]:
+            return self.__segments[i].setItem(key, value)
+
+    """
+    Retrieves the value for a given key.
+    @return any
+    Complexity: T:O(1) average S:O(1)
+    """
+    def getItem(self, key:any)->any:
+        i = self.__segmentOf(key)
+        with self.__locks[i]:
+            return self.__segments[i].getItem(key)
+
+    """
+    Removes the key-value pair if the key exists
+    @return Bool
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def remove(self, key:any)->bool:
+        i = self.__segmentOf(key)
+        with self.__locks[i]:
+            return self.__segments[i].remove(key)
+
+    """
+    Check if a key exists
+    @return bool
+    Complexity: T:O(1) average S:O(1)
+    """
+    def keyExists(self, key:any)->bool:
+        i = self.__segmentOf(key)
+        with self.__locks[i]:
+            return self.__segments[i].keyExists(key)
+
+    """
+    Returns a list of all keys.
+        Each segment is copied under its own lock, so the list is consistent per
+        segment but not a snapshot of the whole table under concurrent writes.
+    @return List
+    Complexity: O(n)
+    """
+    def keys(self)->list:
+        all_keys = []
+        for segment, lock in zip(self.__segments, self.__locks):
+            with lock:
+                all_keys.extend(segment.keys())
+        return all_keys
+
+    """
+    Total number of buckets over all segments
+    @return int
+    Complexity: O(s), where s = number of segments
+    """
+    def capacity(self)->int:
+        return sum(segment.capacity() for segment in self.__segments)
+
+    """
+    Returns the number of key-value pairs.
+        Segments are read without locking, so the count may be stale while other
+        threads are writing.
+    @return int
+    Complexity: O(s), where s = number of segments
+    """
+    def numItems(self)->int:
+        return sum(segment.numItems() for segment in self.__segments)
+
+    """
+    Checks if the table is empty.
+    @return boolean
+    Complexity: O(s), where s = number of segments
+    """
+    def isEmpty(self)->bool:
+        return self.numItems() == 0
+
+    """
+    Clears all items, one segment at a time
+    @return None
+    Complexity: O(s), where s = number of segments
+    """
+    def clear(self)->None:
+        for segment, lock in zip(self.__segments, self.__locks):
+            with lock:
+                segment.clear()
+
+    """
+    Number of key-value pairs, same as numItems().
+    @return int
+    Complexity: O(s), where s = number of segments
+    """
+    def __len__(self)->int:
+        return self.numItems()
+
+    """
+    Supports "key in table", same as keyExists(key).
+    @return boolean
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __contains__(self, key:any)->bool:
+        return self.keyExists(key)
+
+    """
+    Supports "for key in table" over a per-segment copy of the keys.
+    @return Iterator
+    Complexity: T:O(n) S:O(n)
+    """
+    def __iter__(self):
+        return iter(self.keys())
\ No newline at end of file
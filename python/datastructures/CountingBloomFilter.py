@@ -0,0 +1,139 @@
+"""
+CountingBloomFilter Class
+@author Avinash Rai
+
+Probabilistic set membership with deletions.
+Each key sets k of m small counters instead of k bits, so remove() can decrement
+them again. mightContain() is False only if the key was definitely never added
+(or has been removed); True may be a false positive with the configured rate as
+long as no more than expectedItems keys are stored.
+Counters are one byte and saturate at 255: a saturated counter is never
+decremented again, which keeps false negatives impossible.
+
+Works on precomputed integer hashes so callers such as HashTable hash a key once.
+The k slot indexes come from double hashing over a Fibonacci-mixed hash.
+
+Methods overview:
+    - add(keyHash)
+    - remove(keyHash)
+    - mightContain(keyHash)
+    - expectedItems()
+    - falsePositiveRate()
+    - numItems()
+    - clear()
+"""
+import math
+
+class CountingBloomFilter:
+    """
+    Create an instance of CountingBloomFilter sized for expectedItems keys
+    at the given false-positive rate.
+        m = -n ln(p) / ln(2)^2 counters, k = m / n ln(2) hashes
+    Private Members:-
+        - counters bytearray of m counters
+        - size m
+        - numHashes k
+        - expectedItems n the filter was sized for
+        - numItems keys currently added
+    """
+    def __init__(self, expectedItems:int, falsePositiveRate:float=0.01)->None:
+        if expectedItems < 1:
+            raise ValueError("expectedItems must be at least 1")
+        if not 0 < falsePositiveRate < 1:
+            raise ValueError("falsePositiveRate must be between 0 and 1")
+        size = math.ceil(-expectedItems * math.log(falsePositiveRate) / (math.log(2) ** 2))
+        self.__size = max(size, 8)
+        self.__numHashes = max(1, round(self.__size / expectedItems * math.log(2)))
+        self.__counters = bytearray(self.__size)
+        self.__expectedItems = expectedItems
+        self.__falsePositiveRate = falsePositiveRate
+        self.__numItems = 0
+
+    """
+    Private method - The k counter indexes of a hash.
+    @return List of int
+    Complexity: O(k)
+    """
+    def __indexes(self, keyHash):
+        mixed = (keyHash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1 = mixed >> 32
+        h2 = (mixed & 0xFFFFFFFF) | 1
+        size = self.__size
+        return [(h1 + i * h2) % size for i in range(self.__numHashes)]
+
+    """
+    Adds a key hash.
+    @return None
+    Complexity: O(k)
+    """
+    def add(self, keyHash:int)->None:
+        counters = self.__counters
+        for i in self.__indexes(keyHash):
+            if counters[i] < 255:
+                counters[i] += 1
+        self.__numItems += 1
+
+    """
+    Removes a key hash that was previously added.
+        Removing a hash that was never added corrupts the filter.
+    @return None
+    Complexity: O(k)
+    """
+    def remove(self, keyHash:int)->None:
+        counters = self.__counters
+        for i in self.__indexes(keyHash):
+            if 0 < counters[i] < 255:
+                counters[i] -= 1
+        self.__numItems -= 1
+
+    """
+    Checks if a key hash may have been added.
+        Same indexes as __indexes(), computed lazily so a miss usually stops after
+        one or two counters.
+    @return boolean - False means definitely not present
+    Complexity: O(k)
+    """
+    def mightContain(self, keyHash:int)->bool:
+        mixed = (keyHash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        index = mixed >> 32
+        step = (mixed & 0xFFFFFFFF) | 1
+        counters = self.__counters
+        size = self.__size
+        for _ in range(self.__numHashes):
+            if not counters[index % size]:
+                return False
+            index += step
+        return True
+
+    """
+    Number of keys the filter was sized for
+    @return int
+    Complexity: O(1)
+    """
+    def expectedItems(self)->int:
+        return self.__expectedItems
+
+    """
+    Configured false-positive rate at expectedItems keys
+    @return float
+    Complexity: O(1)
+    """
+    def falsePositiveRate(self)->float:
+        return self.__falsePositiveRate
+
+    """
+    Number of keys currently added
+    @return int
+    Complexity: O(1)
+    """
+    def numItems(self)->int:
+        return self.__numItems
+
+    """
+    Resets every counter
+    @return None
+    Complexity: O(m)
+    """
+    def clear(self)->None:
+        self.__counters = bytearray(self.__size)
+        self.__numItems = 0
\ No newline at end of file
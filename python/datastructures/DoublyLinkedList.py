@@ -2,48 +2,356 @@
 Doubly LinkedList Class
 @author Avinash Rai
 
+Indexed mode (indexed=True) adds an indexable skip list on top of the node chain.
+Some nodes are SkipNodes whose tower links jump ahead on higher levels and record
+how many nodes each jump spans, so a position is reached by descending the levels
+instead of walking the chain:
+    - getByIndex, setByIndex, insert, removeByIndex: expected O(log n)
+    - append, prepend, pop, popFirst: expected O(log n), O(1) for most appends
+    - removeByValue, removeNode: O(n), the position of the node must be counted
+    - reverse: O(n), the towers are relinked
+Tower heights are random with P(height > h) = SKIP_PROBABILITY ^ (h - 1), about
+1/3 extra link per node on average.
+
+Hash index mode (hashIndex=True) keeps a HashTable from each value to the list of
+nodes holding it, so find and removeByValue are O(1) for distinct values instead of
+a scan. Values must be hashable. The index is updated by every method that adds,
+removes or re-values a node; assigning node.value directly bypasses it.
+Memory cost: about 270 bytes per distinct value on 64-bit CPython (HashTable entry,
+bucket list and slack, plus a one-node Python list) and 8 bytes per extra duplicate,
+on top of the 56 bytes of each TwoPointerNode.
+A value held by several nodes is not tracked in list order, so find and removeByValue
+fall back to a walk from the head for it and still return the first node in the list.
+
+Outside indexed mode getByIndex remembers the last position it reached (a finger)
+and walks from whichever of head, tail and finger is closest, so i, i+1, i+2, ...
+costs O(1) each. For editing while walking, cursor(index) returns a ListCursor.
+
 Methods overview:
     - append(value)
+    - appendNode(node)
     - prepend(value)
+    - insert(index, value)
     - pop()
     - popFirst()
     - removeByIndex(index)
     - removeByValue(value)
+    - removeNode(node)
     - getByIndex(index)
     - setByIndex(index, value)
     - find(value)
+    - insertAfter(node, value)
+    - insertBefore(node, value)
+    - setNodeValue(node, value)
+    - cursor(index)
     - print()
     - length()
     - isEmpty()
     - reverse()
+    - isIndexed()
+    - hasHashIndex()
+    - sort(key, reverse)
+    - mergeSorted(other, key, reverse)
+    - concat(other)
+    - spliceAfter(node, other)
+    - splitAt(index)
+    - extend(iterable)
+    - DoublyLinkedList.fromIterable(iterable)
+    - len(list), list[index], list[start:stop:step]
+    - for value in list, reversed(list)
 """
+import random
+from itertools import islice
 from datastructures.TwoPointerNode import TwoPointerNode
+from datastructures.SkipNode import SkipNode
+from datastructures.HashTable import HashTable
+from datastructures.NodeChain import indexAdd, indexRemove, mergeChains, sortChain
+from datastructures.ListCursor import ListCursor
 class DoublyLinkedList:
     """
     Create an instance of Doubly Linked List class
         Initialize with a value or create an empty list
+        indexed Keep a skip-list index for O(log n) positional access
+        hashIndex Keep a value -> nodes HashTable for O(1) find and removeByValue
     Private Members:-
         - head pointer
         - tail pointer
         - length counter
+        - indexed flag
+        - header SkipNode holding the first link of every level in indexed mode, otherwise None
+        - valueIndex HashTable value -> list of nodes in hash index mode, otherwise None
+        - fingerNode, fingerIndex Last node reached by getByIndex and its index, None when unknown
     """
-    def __init__(self, value=None)->None:
+    SKIP_PROBABILITY = 0.25
+    SKIP_MAX_LEVEL = 32
+
+    def __init__(self, value=None, indexed:bool=False, hashIndex:bool=False)->None:
+        self.__indexed = indexed
+        self.__header = SkipNode(None) if indexed else None
+        self.__valueIndex = HashTable() if hashIndex else None
+        self.__fingerNode = None
+        self.__fingerIndex = 0
         if value:
             newNode = TwoPointerNode(value)
             self.__head = newNode
             self.__tail = newNode
             self.__length = 1
+            if hashIndex:
+                indexAdd(self.__valueIndex, newNode)
         else:
             self.__head = None
             self.__tail = None
             self.__length = 0    
 
+    """
+    Private method - Keeps the finger valid after a node was inserted at index.
+    @return None
+    Complexity: O(1)
+    """
+    def __fingerInserted(self, index):
+        if self.__fingerNode is not None and self.__fingerIndex >= index:
+            self.__fingerIndex += 1
+
+    """
+    Private method - Keeps the finger valid after the node at index was removed.
+    @return None
+    Complexity: O(1)
+    """
+    def __fingerRemoved(self, index):
+        if self.__fingerNode is not None and self.__fingerIndex >= index:
+            if self.__fingerIndex == index:
+                self.__fingerNode = None
+            else:
+                self.__fingerIndex -= 1
+
+    """
+    Private method - Random tower height for a new node in indexed mode.
+    @return int
+    Complexity: O(1) expected
+    """
+    def __randomHeight(self):
+        height = 1
+        while height < self.SKIP_MAX_LEVEL and random.random() < self.SKIP_PROBABILITY:
+            height += 1
+        return height
+
+    """
+    Private method - For every skip level, the last tower before a position and its position.
+        The header stands at position -1.
+    @return Tuple - (list of towers, list of positions), lowest level first
+    Complexity: T:O(log n) expected S:O(log n)
+    """
+    def __predecessors(self, index):
+        x = self.__header
+        pos = -1
+        levels = len(x.links)
+        update = [None] * levels
+        updatePos = [0] * levels
+        for lvl in range(levels - 1, -1, -1):
+            while x.links[lvl] is not None and pos + x.widths[lvl] < index:
+                pos += x.widths[lvl]
+                x = x.links[lvl]
+            update[lvl] = x
+            updatePos[lvl] = pos
+        return update, updatePos
+
+    """
+    Private method - Node at index - 1 (None for index 0), walked from the lowest predecessor.
+    @return TwoPointerNode/None
+    Complexity: T:O(1) expected S:O(1)
+    """
+    def __nodeBefore(self, index, update, updatePos):
+        if index == 0:
+            return None
+        if index == self.__length:
+            return self.__tail
+        if update and update[0] is not self.__header:
+            temp, pos = update[0], updatePos[0]
+        else:
+            temp, pos = self.__head, 0
+        for _ in range(index - 1 - pos):
+            temp = temp.next
+        return temp
+
+    """
+    Private method - Inserts a value at a position in indexed mode, updating the towers.
+        A height 1 node appended at the tail changes no tower and needs no search.
+    @return Boolean
+    Complexity: T:O(log n) expected S:O(1) expected
+    """
+    def __linkAt(self, index, value):
+        height = self.__randomHeight()
+        newNode = SkipNode(value, height) if height > 1 else TwoPointerNode(value)
+        header = self.__header
+        while len(header.links) < height - 1:
+            header.links.append(None)
+            header.widths.append(0)
+
+        if index == self.__length and height == 1:
+            before = self.__tail
+        else:
+            update, updatePos = self.__predecessors(index)
+            before = self.__nodeBefore(index, update, updatePos)
+            for lvl in range(len(update)):
+                prev = update[lvl]
+                if lvl < height - 1:
+                    if prev.links[lvl] is not None:
+                        newNode.links[lvl] = prev.links[lvl]
+                        newNode.widths[lvl] = updatePos[lvl] + prev.widths[lvl] + 1 - index
+                    prev.links[lvl] = newNode
+                    prev.widths[lvl] = index - updatePos[lvl]
+                elif prev.links[lvl] is not None:
+                    prev.widths[lvl] += 1
+
+        after = self.__head if before is None else before.next
+        newNode.previous = before
+        newNode.next = after
+        if before is None:
+            self.__head = newNode
+        else:
+            before.next = newNode
+        if after is None:
+            self.__tail = newNode
+        else:
+            after.previous = newNode
+        self.__length += 1
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
+        return True
+
+    """
+    Private method - Removes the node at a position in indexed mode, updating the towers.
+    @return TwoPointerNode
+    Complexity: T:O(log n) expected S:O(log n)
+    """
+    def __unlinkAt(self, index):
+        update, updatePos = self.__predecessors(index)
+        before = self.__nodeBefore(index, update, updatePos)
+        target = self.__head if before is None else before.next
+        for lvl in range(len(update)):
+            prev = update[lvl]
+            if prev.links[lvl] is target:
+                prev.links[lvl] = target.links[lvl]
+                prev.widths[lvl] += target.widths[lvl] - 1
+            elif prev.links[lvl] is not None:
+                prev.widths[lvl] -= 1
+        header = self.__header
+        while header.links and header.links[-1] is None:
+            header.links.pop()
+            header.widths.pop()
+        if isinstance(target, SkipNode):
+            target.links = []
+            target.widths = []
+
+        after = target.next
+        if before is None:
+            self.__head = after
+        else:
+            before.next = after
+        if after is None:
+            self.__tail = before
+        else:
+            after.previous = before
+        target.next = None
+        target.previous = None
+        self.__length -= 1
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, target)
+        return target
+
+    """
+    Private method - Relinks every tower in chain order, keeping each node's height.
+        Used after the chain was reordered (reverse, sort) or took in the nodes of
+        another list (mergeSorted).
+    @return None
+    Complexity: T:O(n) S:O(log n)
+    """
+    def __rebuildIndex(self):
+        header = self.__header
+        levels = len(header.links)
+        last = [header] * levels
+        lastPos = [-1] * levels
+        for lvl in range(levels):
+            header.links[lvl] = None
+        pos = 0
+        temp = self.__head
+        while temp is not None:
+            if isinstance(temp, SkipNode):
+                while len(last) < len(temp.links):
+                    header.links.append(None)
+                    header.widths.append(0)
+                    last.append(header)
+                    lastPos.append(-1)
+                for lvl in range(len(temp.links)):
+                    last[lvl].links[lvl] = temp
+                    last[lvl].widths[lvl] = pos - lastPos[lvl]
+                    last[lvl] = temp
+                    lastPos[lvl] = pos
+                    temp.links[lvl] = None
+            pos += 1
+            temp = temp.next
+
+    """
+    Private method - Restores the previous pointers, and the towers in indexed mode,
+        after the chain was relinked by next pointers only (sort, mergeSorted).
+    @return None
+    Complexity: T:O(n) S:O(1)
+    """
+    def __relinkPrevious(self):
+        self.__fingerNode = None
+        previous = None
+        temp = self.__head
+        while temp is not None:
+            temp.previous = previous
+            previous = temp
+            temp = temp.next
+        if self.__indexed:
+            self.__rebuildIndex()
+
+    """
+    Private method - Position of a node of this list, counted from the head.
+    @return int
+    Complexity: T:O(n) S:O(1)
+    """
+    def __indexOf(self, node):
+        index = 0
+        temp = self.__head
+        while temp is not node:
+            temp = temp.next
+            index += 1
+        return index
+
+    """
+    Private method - Takes the whole chain of another list, leaving it empty.
+        The nodes are added to this list's hash index, if any, but not linked yet.
+    @return Tuple - (head, tail, length, other's skip header or None)
+    Complexity: T:O(1) S:O(1), O(m) with a hash index
+    """
+    def __detachAll(self, other):
+        head, tail, length, header = other.__head, other.__tail, other.__length, other.__header
+        other.__head = None
+        other.__tail = None
+        other.__length = 0
+        other.__fingerNode = None
+        if other.__indexed:
+            other.__header = SkipNode(None)
+        if other.__valueIndex is not None:
+            other.__valueIndex = HashTable()
+        if self.__valueIndex is not None:
+            temp = head
+            while temp is not None:
+                indexAdd(self.__valueIndex, temp)
+                temp = temp.next
+        return head, tail, length, header
+
     """
     Adds a node at the end of the list.
     @return Boolean
     Complexity: T:O(1) S:O(1)
     """
     def append(self, value:any)->bool:
+        if self.__indexed:
+            return self.__linkAt(self.__length, value)
         newNode = TwoPointerNode(value)
         if self.__length == 0:
             self.__head = newNode
@@ -53,6 +361,31 @@ class DoublyLinkedList:
             newNode.previous = self.__tail
             self.__tail = newNode
         self.__length += 1
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
+        return True
+
+    """
+    Links an existing detached node at the end of the list.
+        Lets callers that keep node references (e.g. LRUCache) move nodes without allocating.
+        In indexed mode the node joins with height 1, which changes no tower.
+    @return Boolean
+    Complexity: T:O(1) S:O(1)
+    """
+    def appendNode(self, node:TwoPointerNode)->bool:
+        if isinstance(node, SkipNode):
+            node.links = []
+            node.widths = []
+        node.next = None
+        node.previous = self.__tail
+        if self.__length == 0:
+            self.__head = node
+        else:
+            self.__tail.next = node
+        self.__tail = node
+        self.__length += 1
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, node)
         return True
 
     """
@@ -61,6 +394,8 @@ class DoublyLinkedList:
     Complexity: O(1)
     """
     def prepend(self, value:any)->bool:
+        if self.__indexed:
+            return self.__linkAt(0, value)
         newNode = TwoPointerNode(value)
         if self.__length == 0:
             self.__head = newNode
@@ -70,8 +405,37 @@ class DoublyLinkedList:
             self.__head.previous = newNode
             self.__head = newNode
         self.__length += 1
+        self.__fingerInserted(0)
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
         return True
     
+    """
+    Inserts a value so that it ends up at the given index (0 <= index <= length).
+    @return Boolean - False if the index is out of range
+    Complexity: T:O(n/2) S:O(1), T:O(log n) expected in indexed mode
+    """
+    def insert(self, index:int, value:any)->bool:
+        if index < 0 or index > self.__length:
+            return False
+        if self.__indexed:
+            return self.__linkAt(index, value)
+        if index == 0:
+            return self.prepend(value)
+        if index == self.__length:
+            return self.append(value)
+        after = self.getByIndex(index)
+        newNode = TwoPointerNode(value)
+        newNode.previous = after.previous
+        newNode.next = after
+        after.previous.next = newNode
+        after.previous = newNode
+        self.__length += 1
+        self.__fingerInserted(index)
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
+        return True
+
     """
     Removes the last node from the list and return it.
     @return TwoPointerNode/None 
@@ -80,6 +444,8 @@ class DoublyLinkedList:
     def pop(self)->TwoPointerNode:
         if self.__length == 0:
             return None
+        if self.__indexed:
+            return self.__unlinkAt(self.__length - 1)
         temp = self.__tail
         if self.__length == 1:
             self.__head = None
@@ -89,6 +455,9 @@ class DoublyLinkedList:
             self.__tail.next = None
             temp.previous = None
         self.__length -= 1
+        self.__fingerRemoved(self.__length)
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp
 
     """
@@ -99,6 +468,8 @@ class DoublyLinkedList:
     def popFirst(self)->TwoPointerNode:
         if self.__length == 0:
             return None
+        if self.__indexed:
+            return self.__unlinkAt(0)
         temp = self.__head
         if self.__length == 1:
             self.__head = None
@@ -108,16 +479,21 @@ class DoublyLinkedList:
             self.__head.previous = None
             temp.next = None
         self.__length -= 1
+        self.__fingerRemoved(0)
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp 
 
     """
     Removes a node at a specific position.
     @return TwoPointerNode/None
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), T:O(log n) expected in indexed mode
     """
     def removeByIndex(self, index:int)->TwoPointerNode:
         if index < 0 or index >= self.__length:
             return None
+        if self.__indexed:
+            return self.__unlinkAt(index)
         if index == 0:
             return self.popFirst()
         if index == self.__length - 1:
@@ -128,17 +504,35 @@ class DoublyLinkedList:
         temp.next = None
         temp.previous = None
         self.__length -= 1
+        self.__fingerRemoved(index)
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp
 
     """
     Search for a value and remove the first node if found.
+        With the hash index the node is found by find() instead of a scan.
     @return TwoPointerNode/none
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), T:O(1) average with the hash index for distinct values
+                (O(n) if also indexed)
     """
     def removeByValue(self, value:any)->TwoPointerNode:
+        if self.__valueIndex is not None:
+            temp = self.find(value)
+            if temp is None:
+                return None
+            return self.removeNode(temp)
         temp = self.__head
+        if self.__indexed:
+            index = 0
+            while temp is not None:
+                if temp.value is value or temp.value == value:
+                    return self.__unlinkAt(index)
+                temp = temp.next
+                index += 1
+            return None
         while temp is not None:
-            if temp.value == value:
+            if temp.value is value or temp.value == value:
                 if temp == self.__head:
                     return self.popFirst()
                 if temp == self.__tail:
@@ -148,14 +542,42 @@ class DoublyLinkedList:
                 temp.next = None
                 temp.previous = None
                 self.__length -= 1
+                self.__fingerNode = None
                 return temp  # Return the removed node
             temp = temp.next
         return None
 
+    """
+    Unlinks a node that belongs to this list, using its previous/next pointers.
+        The node must be in this list; it is not searched for.
+        In indexed mode its position is counted first, which is O(n).
+    @return TwoPointerNode
+    Complexity: T:O(1) S:O(1)
+    """
+    def removeNode(self, node:TwoPointerNode)->TwoPointerNode:
+        if self.__indexed:
+            return self.__unlinkAt(self.__indexOf(node))
+        if node is self.__head:
+            return self.popFirst()
+        if node is self.__tail:
+            return self.pop()
+        node.previous.next = node.next
+        node.next.previous = node.previous
+        node.next = None
+        node.previous = None
+        self.__length -= 1
+        self.__fingerNode = None
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, node)
+        return node
+
     """
     Returns the node at a given index.
+        Walks from the closest of head, tail and the last position reached.
+        Indexed mode descends the skip levels, then walks the last few nodes.
     @return TwoPointerNode/None
-    Complexity: T:O(n/2) S:O(1)
+    Complexity: T:O(n/2) S:O(1), O(k) for k steps from the last position reached,
+                T:O(log n) expected in indexed mode
     """
     def getByIndex(self, index: int) -> TwoPointerNode:
         if index < 0 or index >= self.__length:
@@ -165,43 +587,128 @@ class DoublyLinkedList:
             return self.__head
         if index == self.__length - 1:
             return self.__tail
+
+        if self.__indexed:
+            temp = self.__header
+            pos = -1
+            for lvl in range(len(temp.links) - 1, -1, -1):
+                while temp.links[lvl] is not None and pos + temp.widths[lvl] <= index:
+                    pos += temp.widths[lvl]
+                    temp = temp.links[lvl]
+            if temp is self.__header:
+                temp, pos = self.__head, 0
+            for _ in range(index - pos):
+                temp = temp.next
+            return temp
     
         if index < self.__length // 2:
-            temp = self.__head
-            for _ in range(index):
-                temp = temp.next
+            temp, pos = self.__head, 0
         else:
-            temp = self.__tail
-            for _ in range(self.__length - 1, index, -1):
-                temp = temp.previous
+            temp, pos = self.__tail, self.__length - 1
+        if self.__fingerNode is not None and abs(index - self.__fingerIndex) < abs(index - pos):
+            temp, pos = self.__fingerNode, self.__fingerIndex
+        for _ in range(index - pos):
+            temp = temp.next
+        for _ in range(pos - index):
+            temp = temp.previous
 
+        self.__fingerNode = temp
+        self.__fingerIndex = index
         return temp
 
     """
     Updates the node at a specific index.
     @return bool - True if updated
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), T:O(log n) expected in indexed mode
     """
     def setByIndex(self, index:int, value:any)->bool:
         temp = self.getByIndex(index)
         if temp is not None:
-            temp.value = value
-            return True
+            return self.setNodeValue(temp, value)
         return False
 
     """
     Returns the index of the first node containing the given value.
+        With the hash index a missing value or a value held by one node is answered
+        without a walk; duplicated values are walked to from the head.
     @return TwoPointerNode/None
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), T:O(1) average with the hash index for distinct values
     """
     def find(self, value:any)->TwoPointerNode:
+        if self.__valueIndex is not None:
+            nodes = self.__valueIndex.getItem(value)
+            if nodes is None:
+                return None
+            if len(nodes) == 1:
+                return nodes[0]
         temp = self.__head
         while temp is not None:
-            if temp.value == value:
+            if temp.value is value or temp.value == value:
                 return temp
             temp = temp.next
         return None
 
+    """
+    Inserts a value right after a node of this list; node None inserts at the head.
+        In indexed mode the position of node is counted first, which is O(n).
+    @return TwoPointerNode - the new node
+    Complexity: O(1)
+    """
+    def insertAfter(self, node:TwoPointerNode, value:any)->TwoPointerNode:
+        if node is None:
+            self.prepend(value)
+            return self.__head
+        if node is self.__tail:
+            self.append(value)
+            return self.__tail
+        if self.__indexed:
+            index = self.__indexOf(node) + 1
+            self.__linkAt(index, value)
+            return node.next
+        newNode = TwoPointerNode(value)
+        newNode.previous = node
+        newNode.next = node.next
+        node.next.previous = newNode
+        node.next = newNode
+        self.__length += 1
+        self.__fingerNode = None
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
+        return newNode
+
+    """
+    Inserts a value right before a node of this list.
+        In indexed mode the position of node is counted first, which is O(n).
+    @return TwoPointerNode - the new node
+    Complexity: O(1)
+    """
+    def insertBefore(self, node:TwoPointerNode, value:any)->TwoPointerNode:
+        return self.insertAfter(node.previous, value)
+
+    """
+    Updates the value of a node of this list, keeping the hash index in sync.
+    @return bool - True if updated
+    Complexity: O(1)
+    """
+    def setNodeValue(self, node:TwoPointerNode, value:any)->bool:
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, node)
+            node.value = value
+            indexAdd(self.__valueIndex, node)
+            return True
+        node.value = value
+        return True
+
+    """
+    Returns a cursor on the node at a given index.
+    @return ListCursor/None - None if the index is out of range
+    Complexity: like getByIndex
+    """
+    def cursor(self, index:int=0)->ListCursor:
+        if index < 0 or index >= self.__length:
+            return None
+        return ListCursor(self, index, True)
+
     """
     Print all items in the list
     Complexity: T:O(n) S:O(1)
@@ -230,6 +737,177 @@ class DoublyLinkedList:
             return False
         return True
     
+    """
+    Checks if the list keeps the skip-list index.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isIndexed(self)->bool:
+        return self.__indexed
+
+    """
+    Checks if the list keeps the value -> nodes hash index.
+    @return boolean
+    Complexity: O(1)
+    """
+    def hasHashIndex(self)->bool:
+        return self.__valueIndex is not None
+
+    """
+    Sorts the list in place with a stable bottom-up merge sort, see NodeChain.sortChain.
+        Nodes are relinked, never copied, and there is no recursion.
+    @return Boolean - True if operation completed
+    Complexity: T:O(n log n) S:O(1)
+    """
+    def sort(self, key=None, reverse:bool=False)->bool:
+        if self.__length < 2:
+            return True
+        self.__head, self.__tail = sortChain(self.__head, self.__length, key, reverse)
+        self.__relinkPrevious()
+        return True
+
+    """
+    Merges another sorted list into this sorted list in one linear pass.
+        Both lists must already be sorted by the same key and order. The nodes of
+        other are relinked into this list, so other is left empty. Stable: on ties
+        the nodes of this list come first.
+    @return Boolean - False if other is this list
+    Complexity: T:O(n + m) S:O(1)
+    """
+    def mergeSorted(self, other:"DoublyLinkedList", key=None, reverse:bool=False)->bool:
+        if other is self:
+            return False
+        moved, _, length, _ = self.__detachAll(other)
+        if moved is None:
+            return True
+        self.__head, self.__tail = mergeChains(self.__head, moved, key, reverse)
+        self.__length += length
+        self.__relinkPrevious()
+        return True
+
+    """
+    Moves every node of another list to the end of this list, leaving other empty.
+        Only the two boundary nodes are relinked. In indexed mode the towers of
+        other are hooked onto the last tower of each level.
+    @return Boolean - False if other is this list
+    Complexity: T:O(1) S:O(1), O(log n) in indexed mode, O(m) more with a hash index
+    """
+    def concat(self, other:"DoublyLinkedList")->bool:
+        if other is self:
+            return False
+        if self.__indexed:
+            update, updatePos = self.__predecessors(self.__length)
+        head, tail, length, header = self.__detachAll(other)
+        if head is None:
+            return True
+
+        if self.__indexed and header is not None:
+            selfHeader = self.__header
+            while len(selfHeader.links) < len(header.links):
+                selfHeader.links.append(None)
+                selfHeader.widths.append(0)
+                update.append(selfHeader)
+                updatePos.append(-1)
+            for lvl in range(len(header.links)):
+                if header.links[lvl] is not None:
+                    update[lvl].links[lvl] = header.links[lvl]
+                    update[lvl].widths[lvl] = self.__length + header.widths[lvl] - 1 - updatePos[lvl]
+
+        if self.__length == 0:
+            self.__head = head
+        else:
+            self.__tail.next = head
+            head.previous = self.__tail
+        self.__tail = tail
+        self.__length += length
+        return True
+
+    """
+    Moves every node of another list in after a node of this list, leaving other empty.
+        node None splices other in at the head. node must belong to this list.
+        Indexed mode counts the position of node, then splits and concatenates.
+    @return Boolean - False if other is this list
+    Complexity: T:O(1) S:O(1), O(n) in indexed mode, O(m) more with a hash index
+    """
+    def spliceAfter(self, node:TwoPointerNode, other:"DoublyLinkedList")->bool:
+        if other is self:
+            return False
+        if self.__indexed:
+            rest = self.splitAt(0 if node is None else self.__indexOf(node) + 1)
+            self.concat(other)
+            self.concat(rest)
+            return True
+
+        head, tail, length, _ = self.__detachAll(other)
+        if head is None:
+            return True
+        after = self.__head if node is None else node.next
+        head.previous = node
+        tail.next = after
+        if node is None:
+            self.__head = head
+        else:
+            node.next = head
+        if after is None:
+            self.__tail = tail
+        else:
+            after.previous = tail
+        self.__length += length
+        self.__fingerNode = None
+        return True
+
+    """
+    Splits the list in two: this list keeps the first index nodes and the rest are
+    moved, not copied, to a new list with the same modes.
+        In indexed mode the towers crossing the cut are split in O(log n).
+    @return DoublyLinkedList/None - None if index is out of range (0 <= index <= length)
+    Complexity: T:O(n/2) S:O(1), O(log n) in indexed mode, O(n - index) more with a hash index
+    """
+    def splitAt(self, index:int)->"DoublyLinkedList":
+        if index < 0 or index > self.__length:
+            return None
+        newList = DoublyLinkedList(indexed=self.__indexed, hashIndex=self.__valueIndex is not None)
+        if index == self.__length:
+            return newList
+
+        first = self.getByIndex(index)
+        if self.__indexed:
+            update, updatePos = self.__predecessors(index)
+            header = newList.__header
+            for lvl in range(len(update)):
+                prev = update[lvl]
+                header.links.append(prev.links[lvl])
+                if prev.links[lvl] is not None:
+                    header.widths.append(updatePos[lvl] + prev.widths[lvl] - index + 1)
+                    prev.links[lvl] = None
+                else:
+                    header.widths.append(0)
+            for skipHeader in (self.__header, header):
+                while skipHeader.links and skipHeader.links[-1] is None:
+                    skipHeader.links.pop()
+                    skipHeader.widths.pop()
+
+        newList.__head = first
+        newList.__tail = self.__tail
+        newList.__length = self.__length - index
+        self.__tail = first.previous
+        if self.__tail is None:
+            self.__head = None
+        else:
+            self.__tail.next = None
+        first.previous = None
+        self.__length = index
+        if self.__fingerIndex >= index:
+            self.__fingerNode = None
+
+        if self.__valueIndex is not None:
+            temp = first
+            while temp is not None:
+                indexRemove(self.__valueIndex, temp)
+                indexAdd(newList.__valueIndex, temp)
+                temp = temp.next
+        return newList
+
     """
     Reverses the list.
     @return Boolean - True if operation completed
@@ -248,4 +926,114 @@ class DoublyLinkedList:
             temp.next, temp.previous = temp.previous, temp.next
             temp = temp.previous
 
-        return True
\ No newline at end of file
+        self.__fingerNode = None
+        if self.__indexed:
+            self.__rebuildIndex()
+        return True
+
+    """
+    Appends every value of an iterable (e.g. a generator) in a single pass.
+        The new nodes are linked to each other first and then attached to the tail.
+        In indexed mode each value is appended through the skip list instead.
+    @return int - number of values added
+    Complexity: T:O(k) S:O(1), where k = number of new values
+    """
+    def extend(self, iterable)->int:
+        if iterable is self:
+            iterable = list(self)
+        if self.__indexed:
+            count = 0
+            for value in iterable:
+                self.__linkAt(self.__length, value)
+                count += 1
+            return count
+        first = last = None
+        count = 0
+        for value in iterable:
+            newNode = TwoPointerNode(value)
+            if last is None:
+                first = newNode
+            else:
+                last.next = newNode
+                newNode.previous = last
+            last = newNode
+            count += 1
+            if self.__valueIndex is not None:
+                indexAdd(self.__valueIndex, newNode)
+        if count == 0:
+            return 0
+        if self.__length == 0:
+            self.__head = first
+        else:
+            self.__tail.next = first
+            first.previous = self.__tail
+        self.__tail = last
+        self.__length += count
+        return count
+
+    """
+    Builds a list from an iterable in a single pass.
+    @return DoublyLinkedList
+    Complexity: T:O(n) S:O(n)
+    """
+    @classmethod
+    def fromIterable(cls, iterable, indexed:bool=False, hashIndex:bool=False)->"DoublyLinkedList":
+        newList = cls(indexed=indexed, hashIndex=hashIndex)
+        newList.extend(iterable)
+        return newList
+
+    """
+    Supports "for value in list", head to tail.
+        Nodes removed while iterating may end the walk early.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        temp = self.__head
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    """
+    Supports reversed(list), tail to head through the previous pointers.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __reversed__(self):
+        temp = self.__tail
+        while temp is not None:
+            yield temp.value
+            temp = temp.previous
+
+    """
+    Length of the list, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__length
+
+    """
+    Supports list[index] and list[start:stop:step].
+        An int index returns the VALUE (negative indexes count from the tail) and
+        raises IndexError if out of range. A slice returns a new DoublyLinkedList;
+        negative steps walk the previous pointers.
+    @return any/DoublyLinkedList
+    Complexity: T:O(n/2) S:O(1) for an index, T:O(n) S:O(k) for a slice
+    """
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step > 0:
+                return DoublyLinkedList.fromIterable(islice(self, start, max(start, stop), step),
+                                                     self.__indexed, self.__valueIndex is not None)
+            last = self.__length - 1
+            return DoublyLinkedList.fromIterable(islice(reversed(self), last - start, max(last - start, last - stop), -step),
+                                                 self.__indexed, self.__valueIndex is not None)
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers or slices")
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("list index out of range")
+        return self.getByIndex(index).value
\ No newline at end of file
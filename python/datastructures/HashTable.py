@@ -4,138 +4,529 @@ HashTable Class
 
 Uses "Seperate Chaining" method using Python Lists for Collision Handling.
 Python List are amortized thus appending to the list are O(1). 
-Resize not implemented yet
+Resizes automatically: the table doubles once numItems exceeds loadFactor * capacity
+and halves once it drops below a quarter of that (never below the initial size).
+Rehashing is INCREMENTAL - the old buckets are migrated a few at a time on every
+following operation, so no single setItem() pays the whole O(n) rebuild.
+Bulk methods (fromItems, setMany, getMany, removeMany) finish any pending resize up
+front and then run one tight loop over the buckets, skipping the per-call dispatch,
+rehash step and load check of the single-item methods.
+save() writes the table to a compact binary file that openMmap() serves read-only
+from an mmap without loading it, see MappedHashTable.
+keys(), values() and items() are lazy generators. Adding or removing keys while one
+is being consumed raises RuntimeError, like a dict.
+With bloomFilterRate set, a CountingBloomFilter of all key hashes is kept up to date
+and getItem/keyExists/remove reject definite misses before any bucket is touched.
+The filter is sized for capacity * loadFactor keys and resizes with the table: a
+resize starts a new filter that fills up as rehashing migrates the entries, and
+lookups check both filters until the migration is done.
+stats() reports chain lengths and the load factor. With trackComparisons=True the
+single-key methods also count how many entries each lookup examined.
+Hashing is pluggable (builtin hash() by default) so any hashable key works.
+Each entry is stored as [key, value, hash]: the full hash is computed once per
+operation, compared before the keys and reused when the entry is rehashed.
+Keys match by identity or equality (k is key or k == key), like a dict, so a key that
+is not equal to itself, such as float('nan'), still finds its own entry.
 
 Methods overview:
-    - _hash(key) Private method
+    - _locate(keyHash) Private method
     - setItem(key,value)
     - getItem(key)
     - keys()
+    - values()
+    - items()
     - remove(key)
     - keyExists(key)
+    - fromItems(iterable, expectedSize) Class method
+    - setMany(items)
+    - getMany(keys)
+    - removeMany(keys)
+    - save(path)
+    - openMmap(path) Static method
     - print()
     - capacity()
     - numItems()
     - isEmpty()
+    - resize(size)
     - clear()
+    - stats()
+    - len(table), key in table, for key in table
 """
+from datastructures.MappedHashTable import MappedHashTable
+from datastructures.CountingBloomFilter import CountingBloomFilter
+
 class HashTable:
     """
     Creates a hash table using a Python list to store key-value pairs.
     Private Members:-
         - map Python List structure to hold the data. Default size is 10
+        - hashFunction Callable key -> int used to hash keys. Default builtin hash()
         - numItems No of items on the HashTable manually tracked to keep O(1) complexity
+        - initialSize Capacity the table never shrinks below
+        - loadFactor Max ratio of numItems to capacity before the table grows
+        - rehashMap Target bucket list while a resize is in progress, otherwise None
+        - rehashIndex Next bucket of map to migrate into rehashMap
+        - rehashSteps Buckets migrated per operation, sized by resize() so a migration
+          ends before the load can reach the next resize threshold
+        - modCount Bumped on every insert/remove/resize, checked by running iterators
+        - trackComparisons When True, lookups and comparisons are counted for stats()
+        - filter CountingBloomFilter of key hashes when bloomFilterRate is set, otherwise None
+        - rehashFilter Filter sized for rehashMap while a resize is in progress, otherwise None
     """
-    def __init__(self, size=10):
+    REHASH_STEP = 4
+
+    def __init__(self, size=10, loadFactor=0.75, hashFunction=hash, trackComparisons=False,
+                 bloomFilterRate=None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if loadFactor <= 0:
+            raise ValueError("loadFactor must be greater than 0")
         self.__map = [None] * size
         self.__numItems = 0
+        self.__hashFunction = hashFunction
+        self.__initialSize = size
+        self.__loadFactor = loadFactor
+        self.__rehashMap = None
+        self.__rehashIndex = 0
+        self.__rehashSteps = HashTable.REHASH_STEP
+        self.__modCount = 0
+        self.__trackComparisons = trackComparisons
+        self.__lookups = 0
+        self.__comparisons = 0
+        self.__bloomFilterRate = bloomFilterRate
+        self.__filter = None
+        self.__rehashFilter = None
+        self.__filterRejections = 0
+        if bloomFilterRate is not None:
+            self.__filter = self.__newFilter(size)
 
     """
-    Private method - Computes a hash value for the given key.
-    @return int
-    Complexity: T:O(k), where k = length of the key | S:O(1)
+    Private method - Returns the bucket list currently responsible for a key hash.
+        While a resize is in progress, buckets below rehashIndex already live in rehashMap.
+    @return List - the table holding the bucket and the bucket index
+    Complexity: O(1)
+    """
+    def __locate(self, keyHash):
+        index = keyHash % len(self.__map)
+        if self.__rehashMap is not None and index < self.__rehashIndex:
+            return self.__rehashMap, keyHash % len(self.__rehashMap)
+        return self.__map, index
+
+    """
+    Private method - Counts one lookup and the entries it examines in the bucket
+    (up to and including the match). Only called when trackComparisons is on.
+    @return None
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __recordLookup(self, bucket, keyHash, key):
+        self.__lookups += 1
+        if bucket is None:
+            return
+        for item in bucket:
+            self.__comparisons += 1
+            if item[2] == keyHash and (item[0] is key or item[0] == key):
+                return
+
+    """
+    Private method - Creates an empty bloom filter for a table of a given capacity.
+    @return CountingBloomFilter
+    Complexity: T:O(capacity) S:O(capacity)
+    """
+    def __newFilter(self, capacity):
+        return CountingBloomFilter(max(int(capacity * self.__loadFactor), 64), self.__bloomFilterRate)
+
+    """
+    Private method - Returns the bloom filter that covers the entries of a bucket list:
+        rehashFilter for rehashMap, filter for map.
+    @return CountingBloomFilter
+    Complexity: O(1)
+    """
+    def __filterFor(self, table):
+        if table is self.__rehashMap:
+            return self.__rehashFilter
+        return self.__filter
+
+    """
+    Private method - True if the bloom filters prove that a key hash is not stored.
+        Both filters are checked while a resize is in progress.
+    @return Boolean
+    Complexity: O(1)
     """
-    def __hashSum(self, key):
-        hash_sum = 0
-        for char in key:
-            hash_sum = (hash_sum + ord(char) * 23) % len(self.__map)
-        return hash_sum
+    def __filterRejects(self, keyHash):
+        if self.__filter.mightContain(keyHash):
+            return False
+        if self.__rehashFilter is not None and self.__rehashFilter.mightContain(keyHash):
+            return False
+        self.__filterRejections += 1
+        return True
+
+    """
+    Private method - Migrates up to steps buckets (default rehashSteps) into rehashMap,
+        adding the moved hashes to rehashFilter. Swaps rehashMap (and rehashFilter) in
+        as the live map once every bucket has been moved. An incremental step that ends
+        the migration checks the load again, which may start the next resize; callers
+        that finish the migration in one go are left with no resize pending.
+    @return None
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def __rehashStep(self, steps=None):
+        if self.__rehashMap is None:
+            return
+        incremental = steps is None
+        if incremental:
+            steps = self.__rehashSteps
+        newSize = len(self.__rehashMap)
+        end = min(self.__rehashIndex + steps, len(self.__map))
+        for i in range(self.__rehashIndex, end):
+            bucket = self.__map[i]
+            if bucket is not None:
+                for item in bucket:
+                    index = item[2] % newSize
+                    if self.__rehashMap[index] is None:
+                        self.__rehashMap[index] = []
+                    self.__rehashMap[index].append(item)
+                    if self.__rehashFilter is not None:
+                        self.__rehashFilter.add(item[2])
+                self.__map[i] = None
+        self.__rehashIndex = end
+        if end == len(self.__map):
+            self.__map = self.__rehashMap
+            self.__rehashMap = None
+            self.__rehashIndex = 0
+            if self.__rehashFilter is not None:
+                self.__filter = self.__rehashFilter
+                self.__rehashFilter = None
+            if incremental:
+                self.__checkLoad()
+
+    """
+    Private method - Starts a resize when the load factor leaves its bounds.
+        Grows x2 above loadFactor, shrinks /2 below loadFactor / 4.
+    @return None
+    Complexity: O(1)
+    """
+    def __checkLoad(self):
+        if self.__rehashMap is not None:
+            return
+        capacity = len(self.__map)
+        if self.__numItems > capacity * self.__loadFactor:
+            self.resize(capacity * 2)
+        elif capacity > self.__initialSize and self.__numItems < capacity * self.__loadFactor / 4:
+            self.resize(max(capacity // 2, self.__initialSize))
 
     """
     Inserts or updates a key-value pair in the hash table.
     @return Bool
-    Complexity: T:O(k), where k = length of the key | S:O(1)
+    Complexity: T:O(1) amortized S:O(1)
     """
     def setItem(self, key:any, value:any) -> bool:
         if value is None:
             return False
 
-        index = self.__hashSum(key)
+        keyHash = self.__hashFunction(key)
+        self.__rehashStep()
+        table, index = self.__locate(keyHash)
+        if self.__trackComparisons:
+            self.__recordLookup(table[index], keyHash, key)
 
-        if self.__map[index] is None:
-            self.__map[index] = []
+        if table[index] is None:
+            table[index] = []
 
-        for item in self.__map[index]:
-            if item[0] == key:
+        for item in table[index]:
+            if item[2] == keyHash and (item[0] is key or item[0] == key):
                 item[1] = value
                 return True
 
-        self.__map[index].append([key, value])
+        table[index].append([key, value, keyHash])
         self.__numItems += 1
+        self.__modCount += 1
+        if self.__filter is not None:
+            self.__filterFor(table).add(keyHash)
+        self.__checkLoad()
         return True
 
     
     """
     Retrieves the value for a given key.
     @return any
-    Complexity: T:O(k), where k = length of the key | S:O(1)
+    Complexity: T:O(1) average S:O(1)
     """
     def getItem(self, key:any)->any:
-        index = self.__hashSum(key)
-        if self.__map[index] == None:
+        keyHash = self.__hashFunction(key)
+        if self.__filter is not None and self.__filterRejects(keyHash):
+            return None
+        self.__rehashStep()
+        table, index = self.__locate(keyHash)
+        if self.__trackComparisons:
+            self.__recordLookup(table[index], keyHash, key)
+        if table[index] == None:
             return None
-        for k,v in self.__map[index]:
-            if k == key:
+        for k,v,h in table[index]:
+            if h == keyHash and (k is key or k == key):
                 return v
         return None        
     
     """
-    Returns a list of all keys in the hash table.
-    @return List
-    Complexity: O(n)
+    Private generator - Yields every [key, value, hash] entry.
+        Finishes a pending resize first so reads made while iterating cannot
+        move entries between bucket lists.
+    @raises RuntimeError if keys are added or removed during iteration
+    Complexity: T:O(n) S:O(1)
     """
-    def keys(self)->list:
-        all_keys = []
-        for item in self.__map:
-            if item is not None:
-                for k,_ in item:
-                    all_keys.append(k)
-        return all_keys
+    def __entries(self):
+        self.__rehashStep(len(self.__map))
+        modCount = self.__modCount
+        for bucket in self.__map:
+            if bucket is not None:
+                for item in bucket:
+                    yield item
+                    if self.__modCount != modCount:
+                        raise RuntimeError("HashTable changed size during iteration")
+
+    """
+    Lazily yields all keys in the hash table.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def keys(self):
+        return (item[0] for item in self.__entries())
+
+    """
+    Lazily yields all values in the hash table.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def values(self):
+        return (item[1] for item in self.__entries())
+
+    """
+    Lazily yields all (key, value) pairs in the hash table.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def items(self):
+        return ((item[0], item[1]) for item in self.__entries())
 
     """
     Removes the key-value pair if the key exists
     @return Bool
-    Complexity: T:O(k), where k = length of the key | S:O(1)
+    Complexity: T:O(1) amortized S:O(1)
     """
     def remove(self, key: any) -> bool: 
-        index = self.__hashSum(key)
-        if self.__map[index] is None:
+        keyHash = self.__hashFunction(key)
+        if self.__filter is not None and self.__filterRejects(keyHash):
             return False
-        for i in range(len(self.__map[index])):
-            if self.__map[index][i][0] == key:
-                self.__map[index].pop(i)
+        self.__rehashStep()
+        table, index = self.__locate(keyHash)
+        if self.__trackComparisons:
+            self.__recordLookup(table[index], keyHash, key)
+        if table[index] is None:
+            return False
+        for i in range(len(table[index])):
+            if table[index][i][2] == keyHash and (table[index][i][0] is key or table[index][i][0] == key):
+                table[index].pop(i)
                 self.__numItems -= 1
+                self.__modCount += 1
+                if self.__filter is not None:
+                    self.__filterFor(table).remove(keyHash)
+                self.__checkLoad()
                 return True
         return False
 
     """
     Check if a key exists in the HashTable
     @return bool
-    Complexity: T:O(k), where k = length of the key | S:O(1)
+    Complexity: T:O(1) average S:O(1)
     """
     def keyExists(self, key:any)->any:
-        index = self.__hashSum(key)
-        if self.__map[index] == None:
+        keyHash = self.__hashFunction(key)
+        if self.__filter is not None and self.__filterRejects(keyHash):
+            return False
+        self.__rehashStep()
+        table, index = self.__locate(keyHash)
+        if self.__trackComparisons:
+            self.__recordLookup(table[index], keyHash, key)
+        if table[index] == None:
             return False
-        for k,v in self.__map[index]:
-            if k == key:
+        for k,v,h in table[index]:
+            if h == keyHash and (k is key or k == key):
                 return True
         return False    
 
+    """
+    Private method - Grows the table synchronously so it can hold numItems entries
+    without exceeding the load factor. Completes any resize in progress.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def __reserve(self, numItems):
+        self.__rehashStep(len(self.__map))
+        size = len(self.__map)
+        while numItems > size * self.__loadFactor:
+            size *= 2
+        if size != len(self.__map):
+            self.resize(size)
+            self.__rehashStep(len(self.__map))
+
+    """
+    Builds a HashTable from an iterable of (key, value) pairs.
+        Pre-sized for expectedSize items (len(iterable) when available) so the
+        load never triggers a resize.
+    @return HashTable
+    Complexity: T:O(n) S:O(n)
+    """
+    @classmethod
+    def fromItems(cls, iterable, expectedSize:int=None, loadFactor=0.75, hashFunction=hash,
+                  bloomFilterRate=None)->"HashTable":
+        table = cls(loadFactor=loadFactor, hashFunction=hashFunction, bloomFilterRate=bloomFilterRate)
+        if expectedSize is None and hasattr(iterable, "__len__"):
+            expectedSize = len(iterable)
+        if expectedSize:
+            table.__reserve(expectedSize)
+        table.setMany(iterable)
+        return table
+
+    """
+    Inserts or updates many (key, value) pairs. Pairs with a None value are skipped.
+        Accepts a dict, a list of pairs or any iterable of pairs.
+    @return int - number of pairs stored
+    Complexity: T:O(m) amortized, where m = number of pairs | S:O(1)
+    """
+    def setMany(self, items)->int:
+        if isinstance(items, dict):
+            items = items.items()
+        if hasattr(items, "__len__"):
+            self.__reserve(self.__numItems + len(items))
+        else:
+            self.__reserve(self.__numItems)
+
+        hashFunction = self.__hashFunction
+        table = self.__map
+        size = len(table)
+        limit = size * self.__loadFactor
+        stored = 0
+        for key, value in items:
+            if value is None:
+                continue
+            keyHash = hashFunction(key)
+            bucket = table[keyHash % size]
+            if bucket is None:
+                bucket = table[keyHash % size] = []
+            for item in bucket:
+                if item[2] == keyHash and (item[0] is key or item[0] == key):
+                    item[1] = value
+                    break
+            else:
+                bucket.append([key, value, keyHash])
+                self.__numItems += 1
+                self.__modCount += 1
+                if self.__filter is not None:
+                    self.__filter.add(keyHash)
+                if self.__numItems > limit:
+                    self.__reserve(self.__numItems + 1)
+                    table = self.__map
+                    size = len(table)
+                    limit = size * self.__loadFactor
+            stored += 1
+        return stored
+
+    """
+    Retrieves the values for many keys, None where a key is missing.
+    @return List - values in the order of keys
+    Complexity: T:O(m), where m = number of keys | S:O(m)
+    """
+    def getMany(self, keys)->list:
+        self.__rehashStep(len(self.__map))
+        hashFunction = self.__hashFunction
+        table = self.__map
+        size = len(table)
+        bloom = self.__filter
+        values = []
+        for key in keys:
+            keyHash = hashFunction(key)
+            value = None
+            if bloom is not None and not bloom.mightContain(keyHash):
+                values.append(value)
+                continue
+            bucket = table[keyHash % size]
+            if bucket is not None:
+                for k,v,h in bucket:
+                    if h == keyHash and (k is key or k == key):
+                        value = v
+                        break
+            values.append(value)
+        return values
+
+    """
+    Removes many keys, ignoring the ones that do not exist.
+        The load factor is checked once at the end.
+    @return int - number of keys removed
+    Complexity: T:O(m), where m = number of keys | S:O(1)
+    """
+    def removeMany(self, keys)->int:
+        self.__rehashStep(len(self.__map))
+        hashFunction = self.__hashFunction
+        table = self.__map
+        size = len(table)
+        removed = 0
+        for key in keys:
+            keyHash = hashFunction(key)
+            bucket = table[keyHash % size]
+            if bucket is None:
+                continue
+            for i in range(len(bucket)):
+                if bucket[i][2] == keyHash and (bucket[i][0] is key or bucket[i][0] == key):
+                    bucket.pop(i)
+                    removed += 1
+                    if self.__filter is not None:
+                        self.__filter.remove(keyHash)
+                    break
+        self.__numItems -= removed
+        self.__modCount += removed
+        self.__checkLoad()
+        return removed
+
+    """
+    Saves all key-value pairs to a compact binary file for openMmap().
+        The file uses its own stable hash, not hashFunction.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def save(self, path)->None:
+        MappedHashTable.write(path, self.items(), self.__numItems)
+
+    """
+    Static method - Opens a file written by save() as a read-only MappedHashTable.
+        getItem/keyExists are answered straight from an mmap of the file.
+    @return MappedHashTable
+    Complexity: O(1)
+    """
+    @staticmethod
+    def openMmap(path)->MappedHashTable:
+        return MappedHashTable(path)
+
     """
     Prints the contents of the hash table (index and bucket values)
+        Buckets still waiting to be migrated are printed first during a resize.
     Complexity: T:O(n) S:O(1)    
     """
     def print(self):
         for i, val in enumerate(self.__map): 
             print(i, ": ", val)
+        if self.__rehashMap is not None:
+            print("-- resizing to", len(self.__rehashMap), "--")
+            for i, val in enumerate(self.__rehashMap): 
+                print(i, ": ", val)
 
     """
     Current Capacity of the Hash Table
+        Reports the target capacity while a resize is in progress.
     @return int
     Complexity: O(1)
     """
     def capacity(self)->int:
+        if self.__rehashMap is not None:
+            return len(self.__rehashMap)
         return len(self.__map)
     
     """
@@ -149,29 +540,105 @@ class HashTable:
     """
     Checks if the Hash Table is empty.
     @return boolean
-    Complexity: T:O(n) S:O(1)
+    Complexity: O(1)
     """
     def isEmpty(self)->bool:
-        for item in self.__map:
-            if item is not None:
-                if len(item) > 0:
-                    return False
-        return True
+        return self.__numItems == 0
 
     """
-    Resize - Not Implemented yet
+    Resize the Hash Table to a new number of buckets.
+        Only allocates the new bucket list (and bloom filter); existing items are
+        migrated incrementally by the following operations, enough buckets per
+        operation to finish before the load reaches the next grow or shrink
+        threshold of the new size. A resize already in progress is completed first.
     @return None
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(size) S:O(size)
     """    
-    def resize(self):
-        pass
+    def resize(self, size:int=None)->None:
+        if self.__rehashMap is not None:
+            self.__rehashStep(len(self.__map))
+        if size is None:
+            size = len(self.__map) * 2
+        if size < 1 or size == len(self.__map):
+            return
+        headroom = int(size * self.__loadFactor) - self.__numItems
+        if size > self.__initialSize:
+            headroom = min(headroom, self.__numItems - int(size * self.__loadFactor / 4))
+        self.__rehashSteps = max(HashTable.REHASH_STEP, -(-len(self.__map) // max(headroom, 1)))
+        self.__rehashMap = [None] * size
+        self.__rehashIndex = 0
+        self.__modCount += 1
+        if self.__filter is not None:
+            self.__rehashFilter = self.__newFilter(size)
     
     """
-    Clears all items 
+    Clears all items and returns the table to its initial capacity
     @return None
     Complexity: T:O(n) S:O(1)
     """
     def clear(self)->None:
-        for i in range(len(self.__map)):
-            self.__map[i] = None
-        self.__numItems = 0
\ No newline at end of file
+        self.__map = [None] * self.__initialSize
+        self.__rehashMap = None
+        self.__rehashIndex = 0
+        self.__numItems = 0
+        self.__modCount += 1
+        if self.__filter is not None:
+            self.__filter = self.__newFilter(self.__initialSize)
+            self.__rehashFilter = None
+
+    """
+    Bucket statistics to judge hash quality and when to resize.
+        Finishes a pending resize first so the numbers describe the final bucket list.
+        lookups/comparisons are only counted with trackComparisons=True and
+        exclude the bulk methods.
+    @return dict - numItems, capacity, loadFactor, emptyBuckets, maxChainLength,
+                   meanChainLength (over non-empty buckets), chainLengths
+                   histogram {length: buckets}, lookups, comparisons,
+                   comparisonsPerLookup, filterRejections (misses answered by the bloom filter)
+    Complexity: T:O(capacity) S:O(k), where k = number of distinct chain lengths
+    """
+    def stats(self)->dict:
+        self.__rehashStep(len(self.__map))
+        histogram = {}
+        for bucket in self.__map:
+            length = 0 if bucket is None else len(bucket)
+            histogram[length] = histogram.get(length, 0) + 1
+        emptyBuckets = histogram.get(0, 0)
+        usedBuckets = len(self.__map) - emptyBuckets
+        return {
+            "numItems": self.__numItems,
+            "capacity": self.capacity(),
+            "loadFactor": self.__numItems / self.capacity(),
+            "emptyBuckets": emptyBuckets,
+            "maxChainLength": max(histogram),
+            "meanChainLength": self.__numItems / usedBuckets if usedBuckets else 0.0,
+            "chainLengths": dict(sorted(histogram.items())),
+            "lookups": self.__lookups,
+            "comparisons": self.__comparisons,
+            "comparisonsPerLookup": self.__comparisons / self.__lookups if self.__lookups else 0.0,
+            "filterRejections": self.__filterRejections,
+        }
+
+    """
+    Number of key-value pairs, same as numItems().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__numItems
+
+    """
+    Supports "key in table", same as keyExists(key).
+    @return boolean
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __contains__(self, key:any)->bool:
+        return self.keyExists(key)
+
+    """
+    Supports "for key in table", same as keys().
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        return self.keys()
\ No newline at end of file
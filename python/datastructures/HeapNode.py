@@ -0,0 +1,16 @@
+"""
+HeapNode Class
+@author Avinash Rai
+
+Entry of a PriorityQueue, returned by push() as a handle for decreaseKey() and remove().
+position is the entry's index in the heap array, -1 once it has left the heap.
+Slotted, since a queue may keep one HeapNode alive per pending entry.
+"""
+
+class HeapNode:
+    __slots__ = ("priority", "value", "position")
+
+    def __init__(self, priority:any, value:any)->None:
+        self.priority = priority
+        self.value = value
+        self.position = -1
\ No newline at end of file
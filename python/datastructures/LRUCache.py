@@ -0,0 +1,218 @@
+"""
+LRUCache Class
+@author Avinash Rai
+
+Least Recently Used cache with an optional per-entry TTL (time to live).
+Built from the two existing structures:
+    - HashTable maps each key to its TwoPointerNode, O(1) lookup
+    - DoublyLinkedList keeps the nodes in usage order, least recent at the head.
+      A hit unlinks its node and re-appends it at the tail, O(1) via the node's
+      previous/next pointers instead of an O(n) removeByValue()
+Each node holds [key, value, expiresAt]. Expired entries are dropped lazily when
+they are read; purgeExpired() drops all of them at once.
+Hit, miss, eviction and expiration counters are kept to help size caches.
+
+Methods overview:
+    - get(key)
+    - put(key, value, ttl)
+    - remove(key)
+    - contains(key)
+    - purgeExpired()
+    - stats()
+    - size()
+    - capacity()
+    - isEmpty()
+    - clear()
+"""
+import time
+from datastructures.HashTable import HashTable
+from datastructures.DoublyLinkedList import DoublyLinkedList
+from datastructures.TwoPointerNode import TwoPointerNode
+
+class LRUCache:
+    """
+    Create an instance of LRUCache class
+        capacity Max number of entries before the least recently used one is evicted
+        ttl Default time to live in seconds for new entries, None = never expires
+        clock Callable returning the current time in seconds. Default time.monotonic
+    Private Members:-
+        - map HashTable key -> TwoPointerNode
+        - order DoublyLinkedList of nodes, least recently used first
+        - hits, misses, evictions, expirations counters
+    """
+    def __init__(self, capacity:int, ttl:float=None, clock=time.monotonic)->None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.__capacity = capacity
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__map = HashTable()
+        self.__order = DoublyLinkedList()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    """
+    Private method - Removes a node from both the map and the usage order.
+    @return None
+    Complexity: O(1)
+    """
+    def __drop(self, node):
+        self.__order.removeNode(node)
+        self.__map.remove(node.value[0])
+
+    """
+    Private method - Returns the live node for a key, dropping it if it has expired.
+    @return TwoPointerNode/None
+    Complexity: O(1)
+    """
+    def __lookup(self, key):
+        node = self.__map.getItem(key)
+        if node is None:
+            return None
+        expiresAt = node.value[2]
+        if expiresAt is not None and expiresAt <= self.__clock():
+            self.__drop(node)
+            self.__expirations += 1
+            return None
+        return node
+
+    """
+    Returns the value for a key and marks it as most recently used.
+    @return any - None on a miss or if the entry has expired
+    Complexity: O(1)
+    """
+    def get(self, key:any)->any:
+        node = self.__lookup(key)
+        if node is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__order.removeNode(node)
+        self.__order.appendNode(node)
+        return node.value[1]
+
+    """
+    Inserts or updates an entry and marks it as most recently used.
+        Evicts the least recently used entry when the cache is full.
+        ttl overrides the cache default for this entry.
+    @return Boolean - False if value is None
+    Complexity: O(1)
+    """
+    def put(self, key:any, value:any, ttl:float=None)->bool:
+        if value is None:
+            return False
+        if ttl is None:
+            ttl = self.__ttl
+        expiresAt = None if ttl is None else self.__clock() + ttl
+
+        node = self.__map.getItem(key)
+        if node is not None:
+            node.value[1] = value
+            node.value[2] = expiresAt
+            self.__order.removeNode(node)
+            self.__order.appendNode(node)
+            return True
+
+        if self.__order.length() >= self.__capacity:
+            self.__drop(self.__order.getByIndex(0))
+            self.__evictions += 1
+
+        node = TwoPointerNode([key, value, expiresAt])
+        self.__order.appendNode(node)
+        self.__map.setItem(key, node)
+        return True
+
+    """
+    Removes an entry if it exists.
+    @return Boolean - True if removed
+    Complexity: O(1)
+    """
+    def remove(self, key:any)->bool:
+        node = self.__map.getItem(key)
+        if node is None:
+            return False
+        self.__drop(node)
+        return True
+
+    """
+    Checks if a live entry exists without changing its usage order or hit/miss counters.
+    @return boolean
+    Complexity: O(1)
+    """
+    def contains(self, key:any)->bool:
+        return self.__lookup(key) is not None
+
+    """
+    Drops every expired entry.
+    @return int - number of entries dropped
+    Complexity: T:O(n) S:O(1)
+    """
+    def purgeExpired(self)->int:
+        now = self.__clock()
+        dropped = 0
+        node = self.__order.getByIndex(0)
+        while node is not None:
+            after = node.next
+            expiresAt = node.value[2]
+            if expiresAt is not None and expiresAt <= now:
+                self.__drop(node)
+                dropped += 1
+            node = after
+        self.__expirations += dropped
+        return dropped
+
+    """
+    Usage counters since creation or the last clear().
+    @return dict - hits, misses, evictions, expirations, hitRate, size, capacity
+    Complexity: O(1)
+    """
+    def stats(self)->dict:
+        lookups = self.__hits + self.__misses
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "expirations": self.__expirations,
+            "hitRate": self.__hits / lookups if lookups else 0.0,
+            "size": self.__order.length(),
+            "capacity": self.__capacity,
+        }
+
+    """
+    Number of entries currently held, including expired ones not yet dropped.
+    @return int
+    Complexity: O(1)
+    """
+    def size(self)->int:
+        return self.__order.length()
+
+    """
+    Max number of entries
+    @return int
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return self.__capacity
+
+    """
+    Checks if the cache is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        return self.__order.isEmpty()
+
+    """
+    Clears all entries and resets the counters.
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        self.__map.clear()
+        self.__order = DoublyLinkedList()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
\ No newline at end of file
@@ -3,9 +3,13 @@ LeftRightNode Class
 @author Avinash Rai
 
 Node with LEFT and RIGHT pointers
+Fields are fixed by __slots__; nodes still hash by identity, which
+BinarySearchTree.isBalanced relies on.
 """
 
 class LeftRightNode:
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value:any)->None:
         self.value = value
         self.left = None
@@ -2,49 +2,110 @@
 LinkedList Class
 @author Avinash Rai
 
+Optional NodePool: nodes removed with popValue()/popFirstValue() are recycled
+by later appends and prepends.
+
+Hash index mode (hashIndex=True) keeps a HashTable from each value to the list of
+nodes holding it. find is O(1) and a missing value is rejected by removeByValue in
+O(1); removing a present value still walks to its predecessor, since nodes have no
+previous pointer. Values must be hashable. The index is updated by every method that
+adds, removes or re-values a node; assigning node.value directly bypasses it.
+Memory cost: about 270 bytes per distinct value on 64-bit CPython (HashTable entry,
+bucket list and slack, plus a one-node Python list) and 8 bytes per extra duplicate,
+on top of the 48 bytes of each Node.
+A value held by several nodes is not tracked in list order, so find and removeByValue
+fall back to a walk from the head for it and still return the first node in the list.
+
+getByIndex remembers the last position it reached (a finger) and starts the next
+walk there when the requested index is not before it, so i, i+1, i+2, ... costs
+O(1) each. For editing while walking, cursor(index) returns a ListCursor.
+
 Methods overview:
     - append(value)
     - prepend(value)
     - pop()
     - popFirst()
+    - popValue()
+    - popFirstValue()
     - removeByIndex(index)
     - removeByValue(value)
     - getByIndex(index)
     - setByIndex(index, value)
     - find(value)
+    - insertAfter(node, value)
+    - removeAfter(node)
+    - setNodeValue(node, value)
+    - cursor(index)
     - print()
     - length()
     - isEmpty()
     - reverse()
+    - hasHashIndex()
+    - sort(key, reverse)
+    - mergeSorted(other, key, reverse)
+    - extend(iterable)
+    - LinkedList.fromIterable(iterable)
+    - len(list), list[index], list[start:stop:step], for value in list, reversed(list)
 """
+from itertools import islice
 from datastructures.Node import Node
+from datastructures.NodePool import NodePool
+from datastructures.HashTable import HashTable
+from datastructures.NodeChain import indexAdd, indexRemove, mergeChains, sortChain
+from datastructures.ListCursor import ListCursor
 class LinkedList:
     """
     Create an instance of Linked List class
         Initialize with a value or empty list
+        pool Optional NodePool to take new nodes from and give removed nodes back to
+        hashIndex Keep a value -> nodes HashTable for O(1) find
     Private Members:-
         - head pointer
         - tail pointer
         - length counter
+        - pool NodePool or None
+        - valueIndex HashTable value -> list of nodes in hash index mode, otherwise None
+        - fingerNode, fingerIndex Last node reached by getByIndex and its index, None when unknown
     """
-    def __init__(self, value=None)->None:
+    def __init__(self, value=None, pool:NodePool=None, hashIndex:bool=False)->None:
+        self.__pool = pool
+        self.__valueIndex = HashTable() if hashIndex else None
+        self.__fingerNode = None
+        self.__fingerIndex = 0
         if value:
-            newNode = Node(value)
+            newNode = pool.acquire(value) if pool is not None else Node(value)
             self.__head = newNode
             self.__tail = newNode
             self.__length = 1
+            if hashIndex:
+                indexAdd(self.__valueIndex, newNode)
         else:
             self.__head = None
             self.__tail = None
             self.__length = 0
 
+    """
+    Private method - Keeps the finger valid after the node at index was removed.
+    @return None
+    Complexity: O(1)
+    """
+    def __fingerRemoved(self, index):
+        if self.__fingerNode is not None and self.__fingerIndex >= index:
+            if self.__fingerIndex == index:
+                self.__fingerNode = None
+            else:
+                self.__fingerIndex -= 1
+
     """
     Adds a node at the end of the list.
     @return Boolean
     Complexity: T:O(1) S:O(1)
     """
     def append(self, value:any)->bool:
-        newNode = Node(value)
+        if self.__pool is not None:
+            newNode = self.__pool.acquire(value)
+        else:
+            newNode = Node(value)
         if self.__length == 0:
             self.__head = newNode
             self.__tail = newNode
@@ -52,6 +113,8 @@ class LinkedList:
             self.__tail.next = newNode
             self.__tail = newNode
         self.__length += 1
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
         return True
     
     """
@@ -60,7 +123,10 @@ class LinkedList:
     Complexity: O(1)
     """
     def prepend(self, value:any)->bool:
-        newNode = Node(value)
+        if self.__pool is not None:
+            newNode = self.__pool.acquire(value)
+        else:
+            newNode = Node(value)
         if self.__length == 0:
             self.__head = newNode
             self.__tail = newNode
@@ -68,6 +134,9 @@ class LinkedList:
             newNode.next = self.__head
             self.__head = newNode
         self.__length += 1   
+        self.__fingerIndex += 1
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
         return True
     
     """
@@ -88,11 +157,14 @@ class LinkedList:
         self.__tail = prev
         self.__tail.next = None
         self.__length -= 1
+        self.__fingerRemoved(self.__length)
 
         if self.__length == 0:
             self.__head = None
             self.__tail = None
 
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp
 
     """
@@ -108,13 +180,53 @@ class LinkedList:
         self.__head = self.__head.next
         temp.next = None
         self.__length -= 1
+        self.__fingerRemoved(0)
 
         if self.__length == 0:
             self.__head = None
             self.__tail = None
 
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp
 
+    """
+    Removes the last node and returns its value.
+        The node never leaves the list, so it goes back to the pool if there is one.
+    @return any/None
+    Complexity: T:O(n) S:O(1)
+    """
+    def popValue(self)->any:
+        temp = self.pop()
+        if temp is None:
+            return None
+        value = temp.value
+        if self.__pool is not None:
+            self.__pool.release(temp)
+        return value
+
+    """
+    Removes the first node and returns its value.
+        The node never leaves the list, so it goes back to the pool if there is one.
+    @return any/None
+    Complexity: O(1)
+    """
+    def popFirstValue(self)->any:
+        if self.__length == 0:
+            return None
+        temp = self.__head
+        self.__head = temp.next
+        self.__length -= 1
+        self.__fingerRemoved(0)
+        if self.__length == 0:
+            self.__tail = None
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
+        value = temp.value
+        if self.__pool is not None:
+            self.__pool.release(temp)
+        return value
+
     """
     Removes a node at a specific position.
     @return Node/none
@@ -132,19 +244,31 @@ class LinkedList:
         prev.next = temp.next
         temp.next = None
         self.__length -= 1
+        self.__fingerRemoved(index)
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
         return temp
 
     """
     Search for a value and remove the first node found.
+        With the hash index a missing value returns at once and a value held by one
+        node is matched by identity on the walk to its predecessor.
     @return Node/none
     Complexity: T:O(n) S:O(1)
     """
     def removeByValue(self, value:any)->Node:
+        target = None
+        if self.__valueIndex is not None:
+            nodes = self.__valueIndex.getItem(value)
+            if nodes is None:
+                return None
+            if len(nodes) == 1:
+                target = nodes[0]
         temp = self.__head
         prev = None
 
         while temp is not None:
-            if temp.value == value:
+            if temp is target or (target is None and (temp.value is value or temp.value == value)):
                 if prev is not None:
                     prev.next = temp.next
                 else:
@@ -154,6 +278,9 @@ class LinkedList:
                     self.__tail = prev
                 
                 self.__length -= 1
+                self.__fingerNode = None
+                if self.__valueIndex is not None:
+                    indexRemove(self.__valueIndex, temp)
                 return temp
         
             prev = temp
@@ -163,15 +290,25 @@ class LinkedList:
 
     """
     Returns the node at a given index.
+        Walks from the last position reached when index is not before it,
+        otherwise from the head.
     @return Node/None
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), O(k) for k steps past the last position reached
     """
     def getByIndex(self, index:int)->Node:
         if index < 0 or index >= self.__length:
             return None
+        if index == self.__length - 1:
+            return self.__tail
         temp = self.__head
-        for i in range(index):
+        start = 0
+        if self.__fingerNode is not None and self.__fingerIndex <= index:
+            temp = self.__fingerNode
+            start = self.__fingerIndex
+        for i in range(index - start):
             temp = temp.next
+        self.__fingerNode = temp
+        self.__fingerIndex = index
         return temp
 
     """
@@ -182,22 +319,95 @@ class LinkedList:
     def setByIndex(self, index:int, value:any)->bool:
         temp = self.getByIndex(index)
         if temp is not None:
-            temp.value = value
-            return True
+            return self.setNodeValue(temp, value)
         return False
 
     """
     Returns the index of the first node containing the given value.
+        With the hash index a missing value or a value held by one node is answered
+        without a walk; duplicated values are walked to from the head.
     @return Node/none
-    Complexity: T:O(n) S:O(1)
+    Complexity: T:O(n) S:O(1), T:O(1) average with the hash index for distinct values
     """
     def find(self, value:any)->Node:
+        if self.__valueIndex is not None:
+            nodes = self.__valueIndex.getItem(value)
+            if nodes is None:
+                return None
+            if len(nodes) == 1:
+                return nodes[0]
         temp = self.__head
         while temp:
-            if temp.value == value:
+            if temp.value is value or temp.value == value:
                 return temp
             temp = temp.next
         return None
+
+    """
+    Inserts a value right after a node of this list; node None inserts at the head.
+    @return Node - the new node
+    Complexity: O(1)
+    """
+    def insertAfter(self, node:Node, value:any)->Node:
+        if node is None:
+            self.prepend(value)
+            return self.__head
+        if node is self.__tail:
+            self.append(value)
+            return self.__tail
+        newNode = self.__pool.acquire(value) if self.__pool is not None else Node(value)
+        newNode.next = node.next
+        node.next = newNode
+        self.__length += 1
+        self.__fingerNode = None
+        if self.__valueIndex is not None:
+            indexAdd(self.__valueIndex, newNode)
+        return newNode
+
+    """
+    Removes the node right after a node of this list; node None removes the head.
+    @return Node/None - None if node is the tail
+    Complexity: O(1)
+    """
+    def removeAfter(self, node:Node)->Node:
+        if node is None:
+            return self.popFirst()
+        temp = node.next
+        if temp is None:
+            return None
+        node.next = temp.next
+        if temp is self.__tail:
+            self.__tail = node
+        temp.next = None
+        self.__length -= 1
+        self.__fingerNode = None
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, temp)
+        return temp
+
+    """
+    Updates the value of a node of this list, keeping the hash index in sync.
+    @return bool - True if updated
+    Complexity: O(1)
+    """
+    def setNodeValue(self, node:Node, value:any)->bool:
+        if self.__valueIndex is not None:
+            indexRemove(self.__valueIndex, node)
+            node.value = value
+            indexAdd(self.__valueIndex, node)
+            return True
+        node.value = value
+        return True
+
+    """
+    Returns a cursor on the node at a given index.
+    @return ListCursor/None - None if the index is out of range
+    Complexity: T:O(n) S:O(1), from the last position reached like getByIndex
+    """
+    def cursor(self, index:int=0)->ListCursor:
+        if index < 0 or index >= self.__length:
+            return None
+        return ListCursor(self, index, False)
     
     """
     Print all items in the Linked List
@@ -250,4 +460,160 @@ class LinkedList:
             before = temp
             temp = after
         
-        return True
\ No newline at end of file
+        self.__fingerNode = None
+        return True
+
+    """
+    Checks if the list keeps the value -> nodes hash index.
+    @return boolean
+    Complexity: O(1)
+    """
+    def hasHashIndex(self)->bool:
+        return self.__valueIndex is not None
+
+    """
+    Sorts the list in place with a stable bottom-up merge sort, see NodeChain.sortChain.
+        Nodes are relinked, never copied, and there is no recursion.
+    @return Boolean - True if operation completed
+    Complexity: T:O(n log n) S:O(1)
+    """
+    def sort(self, key=None, reverse:bool=False)->bool:
+        if self.__length < 2:
+            return True
+        self.__head, self.__tail = sortChain(self.__head, self.__length, key, reverse)
+        self.__fingerNode = None
+        return True
+
+    """
+    Merges another sorted list into this sorted list in one linear pass.
+        Both lists must already be sorted by the same key and order. The nodes of
+        other are relinked into this list, so other is left empty. Stable: on ties
+        the nodes of this list come first.
+    @return Boolean - False if other is this list
+    Complexity: T:O(n + m) S:O(1)
+    """
+    def mergeSorted(self, other:"LinkedList", key=None, reverse:bool=False)->bool:
+        if other is self:
+            return False
+        if other.__length == 0:
+            return True
+        moved = other.__head
+        if other.__valueIndex is not None:
+            other.__valueIndex = HashTable()
+        if self.__valueIndex is not None:
+            temp = moved
+            while temp is not None:
+                indexAdd(self.__valueIndex, temp)
+                temp = temp.next
+        self.__head, self.__tail = mergeChains(self.__head, moved, key, reverse)
+        self.__length += other.__length
+        other.__head = None
+        other.__tail = None
+        other.__length = 0
+        other.__fingerNode = None
+        self.__fingerNode = None
+        return True
+
+    """
+    Appends every value of an iterable (e.g. a generator) in a single pass.
+        The new nodes are linked to each other first and then attached to the tail.
+    @return int - number of values added
+    Complexity: T:O(k) S:O(1), where k = number of new values
+    """
+    def extend(self, iterable)->int:
+        if iterable is self:
+            iterable = list(self)
+        pool = self.__pool
+        first = last = None
+        count = 0
+        for value in iterable:
+            newNode = pool.acquire(value) if pool is not None else Node(value)
+            if last is None:
+                first = newNode
+            else:
+                last.next = newNode
+            last = newNode
+            count += 1
+            if self.__valueIndex is not None:
+                indexAdd(self.__valueIndex, newNode)
+        if count == 0:
+            return 0
+        if self.__length == 0:
+            self.__head = first
+        else:
+            self.__tail.next = first
+        self.__tail = last
+        self.__length += count
+        return count
+
+    """
+    Builds a list from an iterable in a single pass.
+    @return LinkedList
+    Complexity: T:O(n) S:O(n)
+    """
+    @classmethod
+    def fromIterable(cls, iterable, pool:NodePool=None, hashIndex:bool=False)->"LinkedList":
+        newList = cls(pool=pool, hashIndex=hashIndex)
+        newList.extend(iterable)
+        return newList
+
+    """
+    Supports "for value in list", head to tail.
+        Nodes removed while iterating may end the walk early.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        temp = self.__head
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    """
+    Supports "reversed(list)", tail to head.
+        Nodes have no previous pointer, so the nodes are collected in one walk from
+        the head and yielded backwards, instead of Python falling back to
+        list[i] for every i (an O(n) walk each).
+    @return Iterator of values
+    Complexity: T:O(n) S:O(n)
+    """
+    def __reversed__(self):
+        nodes = []
+        temp = self.__head
+        while temp is not None:
+            nodes.append(temp)
+            temp = temp.next
+        for node in reversed(nodes):
+            yield node.value
+
+    """
+    Length of the list, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__length
+
+    """
+    Supports list[index] and list[start:stop:step].
+        An int index returns the VALUE (negative indexes count from the tail) and
+        raises IndexError if out of range. A slice returns a new LinkedList.
+    @return any/LinkedList
+    Complexity: T:O(n) S:O(1) for an index, T:O(n) S:O(k) for a slice
+    """
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step > 0:
+                return LinkedList.fromIterable(islice(self, start, max(start, stop), step), self.__pool,
+                                               self.__valueIndex is not None)
+            return LinkedList.fromIterable(list(self)[index], self.__pool, self.__valueIndex is not None)
+        if not isinstance(index, int):
+            raise TypeError("list indices must be integers or slices")
+        if index < 0:
+            index += self.__length
+        if index < 0 or index >= self.__length:
+            raise IndexError("list index out of range")
+        if index == self.__length - 1:
+            return self.__tail.value
+        return self.getByIndex(index).value
\ No newline at end of file
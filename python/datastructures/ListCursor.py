@@ -0,0 +1,219 @@
+"""
+ListCursor Class
+@author Avinash Rai
+
+Cursor (finger) over a LinkedList or DoublyLinkedList, created by list.cursor(index).
+Remembers a node and its index, so moving by k costs O(k) walks instead of a
+getByIndex() walk from the head every time, and edits at the cursor are O(1).
+    - DoublyLinkedList: next(k) and previous(k) are O(k). In indexed mode long moves
+      use getByIndex() and edits go through the O(log n) index methods.
+    - LinkedList: the cursor also keeps the node before it, so insertBefore() and
+      remove() are O(1). next(k) is O(k) but previous(k) walks from the list's
+      remembered position or the head, O(index).
+Edits made to the list other than through this cursor invalidate it.
+
+Methods overview:
+    - index()
+    - value()
+    - node()
+    - isValid()
+    - moveTo(index)
+    - next(k)
+    - previous(k)
+    - set(value)
+    - insertBefore(value)
+    - insertAfter(value)
+    - remove()
+"""
+
+class ListCursor:
+    """
+    Create a cursor on a list at a valid index. Use list.cursor(index) instead.
+    Private Members:-
+        - list LinkedList or DoublyLinkedList
+        - doubly True for DoublyLinkedList
+        - node Node under the cursor, None once the list has been emptied through it
+        - index position of node
+        - before Node before node (LinkedList only), None at the head
+    """
+    LONG_MOVE = 32
+
+    def __init__(self, linkedList, index:int, doubly:bool)->None:
+        self.__list = linkedList
+        self.__doubly = doubly
+        self.__index = index
+        self.__before = None
+        if doubly or index == 0:
+            self.__node = linkedList.getByIndex(index)
+        else:
+            self.__before = linkedList.getByIndex(index - 1)
+            self.__node = self.__before.next
+
+    """
+    Index of the node under the cursor
+    @return int/None - None if the cursor is not on a node
+    Complexity: O(1)
+    """
+    def index(self)->int:
+        if self.__node is None:
+            return None
+        return self.__index
+
+    """
+    Value of the node under the cursor
+    @return any/None
+    Complexity: O(1)
+    """
+    def value(self)->any:
+        if self.__node is None:
+            return None
+        return self.__node.value
+
+    """
+    Node under the cursor
+    @return Node/TwoPointerNode/None
+    Complexity: O(1)
+    """
+    def node(self):
+        return self.__node
+
+    """
+    Checks if the cursor is on a node.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isValid(self)->bool:
+        return self.__node is not None
+
+    """
+    Moves the cursor to an index, walking from its current node.
+    @return Boolean - False if the index is out of range, the cursor does not move
+    Complexity: T:O(k) S:O(1), k = distance moved. LinkedList backwards: O(index)
+    """
+    def moveTo(self, index:int)->bool:
+        if self.__node is None or index < 0 or index >= self.__list.length():
+            return False
+        delta = index - self.__index
+        if self.__doubly:
+            if self.__list.isIndexed() and abs(delta) > self.LONG_MOVE:
+                self.__node = self.__list.getByIndex(index)
+            else:
+                temp = self.__node
+                for _ in range(delta):
+                    temp = temp.next
+                for _ in range(-delta):
+                    temp = temp.previous
+                self.__node = temp
+        elif delta >= 0:
+            before, temp = self.__before, self.__node
+            for _ in range(delta):
+                before, temp = temp, temp.next
+            self.__before, self.__node = before, temp
+        elif index == 0:
+            self.__before = None
+            self.__node = self.__list.getByIndex(0)
+        else:
+            self.__before = self.__list.getByIndex(index - 1)
+            self.__node = self.__before.next
+        self.__index = index
+        return True
+
+    """
+    Moves the cursor k nodes towards the tail.
+    @return Boolean - False if that is past the end, the cursor does not move
+    Complexity: T:O(k) S:O(1)
+    """
+    def next(self, k:int=1)->bool:
+        if self.__node is None:
+            return False
+        return self.moveTo(self.__index + k)
+
+    """
+    Moves the cursor k nodes towards the head.
+    @return Boolean - False if that is before the head, the cursor does not move
+    Complexity: T:O(k) S:O(1), LinkedList: O(index)
+    """
+    def previous(self, k:int=1)->bool:
+        if self.__node is None:
+            return False
+        return self.moveTo(self.__index - k)
+
+    """
+    Replaces the value under the cursor, keeping the list's hash index in sync.
+    @return Boolean - False if the cursor is not on a node
+    Complexity: O(1)
+    """
+    def set(self, value:any)->bool:
+        if self.__node is None:
+            return False
+        return self.__list.setNodeValue(self.__node, value)
+
+    """
+    Inserts a value before the cursor; the cursor stays on its node.
+    @return Boolean - False if the cursor is not on a node
+    Complexity: O(1), O(log n) in indexed mode
+    """
+    def insertBefore(self, value:any)->bool:
+        if self.__node is None:
+            return False
+        if not self.__doubly:
+            self.__before = self.__list.insertAfter(self.__before, value)
+        elif self.__list.isIndexed():
+            self.__list.insert(self.__index, value)
+        else:
+            self.__list.insertBefore(self.__node, value)
+        self.__index += 1
+        return True
+
+    """
+    Inserts a value after the cursor; the cursor stays on its node.
+    @return Boolean - False if the cursor is not on a node
+    Complexity: O(1), O(log n) in indexed mode
+    """
+    def insertAfter(self, value:any)->bool:
+        if self.__node is None:
+            return False
+        if self.__doubly and self.__list.isIndexed():
+            self.__list.insert(self.__index + 1, value)
+        else:
+            self.__list.insertAfter(self.__node, value)
+        return True
+
+    """
+    Removes the node under the cursor and returns its value.
+        The cursor moves to the next node, or to the new last node if the tail was
+        removed, or becomes invalid if the list is now empty.
+    @return any/None - None if the cursor is not on a node
+    Complexity: O(1), O(log n) in indexed mode. LinkedList tail: O(n)
+    """
+    def remove(self)->any:
+        node = self.__node
+        if node is None:
+            return None
+        value = node.value
+        after = node.next
+        if not self.__doubly:
+            self.__list.removeAfter(self.__before)
+            if after is not None:
+                self.__node = after
+            elif self.__before is not None:
+                self.__index -= 1
+                self.__node = self.__before
+                self.__before = self.__list.getByIndex(self.__index - 1) if self.__index > 0 else None
+            else:
+                self.__node = None
+            return value
+
+        before = node.previous
+        if self.__list.isIndexed():
+            self.__list.removeByIndex(self.__index)
+        else:
+            self.__list.removeNode(node)
+        if after is not None:
+            self.__node = after
+        elif before is not None:
+            self.__index -= 1
+            self.__node = before
+        else:
+            self.__node = None
+        return value
\ No newline at end of file
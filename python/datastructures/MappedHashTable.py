@@ -0,0 +1,260 @@
+"""
+MappedHashTable Class
+@author Avinash Rai
+
+Read-only HashTable answered straight from an mmap of a file written by
+HashTable.save(). Opening is O(1): nothing is deserialised up front, a lookup
+only touches the probed slots and unpickles the one value it returns. The file
+is mapped read-only, so worker processes opening the same file share its pages
+through the OS page cache.
+
+File layout (little endian):
+    - header  magic "DSAHT1", slot count, item count
+    - slots   slot count x (hash: uint64, entry offset: uint64), offset 0 = empty
+    - entries key length: uint32, value length: uint32, pickled key, pickled value
+Slots use Open Addressing with Linear Probing at a load factor of at most 0.5.
+Keys are hashed with blake2b over their pickled bytes, because builtin hash() is
+randomised per process; keys match when their pickled bytes match, so 1 and 1.0
+are different keys in a mapped table.
+
+Methods overview:
+    - write(path, items, numItems) Static method
+    - getItem(key)
+    - keyExists(key)
+    - keys()
+    - values()
+    - items()
+    - capacity()
+    - numItems()
+    - isEmpty()
+    - close()
+    - len(table), key in table, for key in table, with-statement
+"""
+import mmap
+import pickle
+import struct
+from hashlib import blake2b
+
+class MappedHashTable:
+    """
+    Opens a file written by HashTable.save() / MappedHashTable.write().
+    Private Members:-
+        - file, mmap, view Open file, its read-only mapping and a memoryview over it
+        - mask slot count - 1, maps a hash to a slot
+        - numItems No of items stored in the file
+    """
+    MAGIC = b"DSAHT1\0\0"
+    HEADER = struct.Struct("<8sQQ")
+    SLOT = struct.Struct("<QQ")
+    ENTRY = struct.Struct("<II")
+    PICKLE_PROTOCOL = 4
+
+    def __init__(self, path)->None:
+        self.__file = open(path, "rb")
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.__file.close()
+            raise
+        self.__view = memoryview(self.__mmap)
+        magic, slotCount, numItems = self.HEADER.unpack_from(self.__mmap, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a saved HashTable")
+        self.__mask = slotCount - 1
+        self.__numItems = numItems
+
+    """
+    Static method - Private. Stable 64 bit hash of a pickled key.
+    @return int
+    Complexity: T:O(k), where k = length of the pickled key | S:O(1)
+    """
+    @staticmethod
+    def __hash(keyBytes):
+        return int.from_bytes(blake2b(keyBytes, digest_size=8).digest(), "little")
+
+    """
+    Static method - Writes (key, value) pairs to path in the mapped file format.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    @staticmethod
+    def write(path, items, numItems:int)->None:
+        slotCount = 8
+        while slotCount < numItems * 2:
+            slotCount *= 2
+        mask = slotCount - 1
+        slots = bytearray(slotCount * MappedHashTable.SLOT.size)
+        offset = MappedHashTable.HEADER.size + len(slots)
+
+        with open(path, "wb") as f:
+            f.write(MappedHashTable.HEADER.pack(MappedHashTable.MAGIC, slotCount, numItems))
+            f.write(slots)
+            written = 0
+            for key, value in items:
+                keyBytes = pickle.dumps(key, MappedHashTable.PICKLE_PROTOCOL)
+                valueBytes = pickle.dumps(value, MappedHashTable.PICKLE_PROTOCOL)
+                keyHash = MappedHashTable.__hash(keyBytes)
+                i = keyHash & mask
+                while MappedHashTable.SLOT.unpack_from(slots, i * MappedHashTable.SLOT.size)[1] != 0:
+                    i = (i + 1) & mask
+                MappedHashTable.SLOT.pack_into(slots, i * MappedHashTable.SLOT.size, keyHash, offset)
+                f.write(MappedHashTable.ENTRY.pack(len(keyBytes), len(valueBytes)))
+                f.write(keyBytes)
+                f.write(valueBytes)
+                offset += MappedHashTable.ENTRY.size + len(keyBytes) + len(valueBytes)
+                written += 1
+            if written != numItems:
+                raise ValueError("numItems does not match the number of items written")
+            f.seek(MappedHashTable.HEADER.size)
+            f.write(slots)
+
+    """
+    Private method - Returns the (key start, value start, value end) of an entry
+    in the mapping, or None if the key is not stored.
+    @return Tuple/None
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __find(self, key):
+        keyBytes = pickle.dumps(key, self.PICKLE_PROTOCOL)
+        keyHash = self.__hash(keyBytes)
+        view = self.__view
+        mask = self.__mask
+        i = keyHash & mask
+        while True:
+            slotHash, offset = self.SLOT.unpack_from(view, self.HEADER.size + i * self.SLOT.size)
+            if offset == 0:
+                return None
+            if slotHash == keyHash:
+                keyLen, valueLen = self.ENTRY.unpack_from(view, offset)
+                start = offset + self.ENTRY.size
+                if keyLen == len(keyBytes) and view[start:start + keyLen] == keyBytes:
+                    return start, start + keyLen, start + keyLen + valueLen
+            i = (i + 1) & mask
+
+    """
+    Retrieves the value for a given key, unpickling only that value.
+    @return any
+    Complexity: T:O(1) average S:O(1)
+    """
+    def getItem(self, key:any)->any:
+        entry = self.__find(key)
+        if entry is None:
+            return None
+        return pickle.loads(self.__view[entry[1]:entry[2]])
+
+    """
+    Check if a key exists without unpickling anything.
+    @return bool
+    Complexity: T:O(1) average S:O(1)
+    """
+    def keyExists(self, key:any)->bool:
+        return self.__find(key) is not None
+
+    """
+    Private generator - Yields (key start, value start, value end) of every entry in file order.
+    Complexity: T:O(n) S:O(1)
+    """
+    def __entries(self):
+        view = self.__view
+        offset = self.HEADER.size + (self.__mask + 1) * self.SLOT.size
+        for _ in range(self.__numItems):
+            keyLen, valueLen = self.ENTRY.unpack_from(view, offset)
+            start = offset + self.ENTRY.size
+            yield start, start + keyLen, start + keyLen + valueLen
+            offset = start + keyLen + valueLen
+
+    """
+    Lazily yields all keys in the file.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def keys(self):
+        return (pickle.loads(self.__view[k:v]) for k, v, _ in self.__entries())
+
+    """
+    Lazily yields all values in the file.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def values(self):
+        return (pickle.loads(self.__view[v:end]) for _, v, end in self.__entries())
+
+    """
+    Lazily yields all (key, value) pairs in the file.
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def items(self):
+        return ((pickle.loads(self.__view[k:v]), pickle.loads(self.__view[v:end]))
+                for k, v, end in self.__entries())
+
+    """
+    Number of slots in the file
+    @return int
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return self.__mask + 1
+
+    """
+    Returns the number of key-value pairs stored in the file.
+    @return int
+    Complexity: O(1)
+    """
+    def numItems(self)->int:
+        return self.__numItems
+
+    """
+    Checks if the table is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        return self.__numItems == 0
+
+    """
+    Unmaps and closes the file. The table cannot be used afterwards.
+    @return None
+    Complexity: O(1)
+    """
+    def close(self)->None:
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+        if not self.__mmap.closed:
+            self.__mmap.close()
+        self.__file.close()
+
+    """
+    Number of key-value pairs, same as numItems().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__numItems
+
+    """
+    Supports "key in table", same as keyExists(key).
+    @return boolean
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __contains__(self, key:any)->bool:
+        return self.keyExists(key)
+
+    """
+    Supports "for key in table", same as keys().
+    @return Generator
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        return self.keys()
+
+    """
+    Supports "with HashTable.openMmap(path) as table:", closing the file on exit.
+    """
+    def __enter__(self)->"MappedHashTable":
+        return self
+
+    def __exit__(self, *exc)->None:
+        self.close()
\ No newline at end of file
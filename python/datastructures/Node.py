@@ -1,9 +1,13 @@
 """
 Node Class
 @author Avinash Rai
+
+Uses __slots__ instead of an instance __dict__ to keep every node compact.
 """
 
 class Node:
+    __slots__ = ("value", "next")
+
     def __init__(self, value:any)->None:
         self.value = value
         self.next = None
\ No newline at end of file
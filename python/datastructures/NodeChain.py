@@ -0,0 +1,127 @@
+"""
+NodeChain helpers
+@author Avinash Rai
+
+Functions shared by LinkedList and DoublyLinkedList for None-terminated chains of
+nodes linked by next. They only set next pointers, so DoublyLinkedList relinks
+the previous pointers itself afterwards.
+indexAdd/indexRemove maintain the value -> list of nodes HashTable of hash index mode.
+
+Methods overview:
+    - mergeChains(left, right, key, reverse)
+    - sortChain(head, length, key, reverse)
+    - indexAdd(valueIndex, node)
+    - indexRemove(valueIndex, node)
+"""
+from datastructures.Node import Node
+
+"""
+Merges two sorted chains after a given tail node.
+    Stable: on ties the node from left comes first.
+@return Node - the last node of the merged chain
+Complexity: T:O(a + b) S:O(1)
+"""
+def _mergeAfter(tail, left, right, key, reverse):
+    if key is None and not reverse:
+        while left is not None and right is not None:
+            if right.value < left.value:
+                tail.next = tail = right
+                right = right.next
+            else:
+                tail.next = tail = left
+                left = left.next
+    while left is not None and right is not None:
+        a = left.value
+        b = right.value
+        if key is not None:
+            a = key(a)
+            b = key(b)
+        if (a < b) if reverse else (b < a):
+            tail.next = tail = right
+            right = right.next
+        else:
+            tail.next = tail = left
+            left = left.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return tail
+
+"""
+Merges two sorted chains into one. Stable: on ties the node from left comes first.
+@return Tuple - (head, tail) of the merged chain
+Complexity: T:O(a + b) S:O(1)
+"""
+def mergeChains(left, right, key=None, reverse:bool=False)->tuple:
+    dummy = Node(None)
+    tail = _mergeAfter(dummy, left, right, key, reverse)
+    return dummy.next, tail
+
+"""
+Sorts a chain of length nodes with a stable bottom-up merge sort.
+    Nodes are relinked, never copied, and there is no recursion: runs of width
+    1, 2, 4, ... are cut off the chain and merged pairwise until one run is left.
+    key is called on both values of every comparison instead of being cached
+    per element, so nothing is allocated per node.
+@return Tuple - (head, tail) of the sorted chain
+Complexity: T:O(n log n) S:O(1)
+"""
+def sortChain(head, length:int, key=None, reverse:bool=False)->tuple:
+    dummy = Node(None)
+    dummy.next = head
+    tail = head
+    width = 1
+    while width < length:
+        tail = dummy
+        temp = dummy.next
+        while temp is not None:
+            left = temp
+            for _ in range(width - 1):
+                if temp.next is None:
+                    break
+                temp = temp.next
+            right = temp.next
+            temp.next = None
+            temp = right
+            for _ in range(width - 1):
+                if temp is None or temp.next is None:
+                    break
+                temp = temp.next
+            if temp is not None:
+                after = temp.next
+                temp.next = None
+                temp = after
+            tail = _mergeAfter(tail, left, right, key, reverse)
+        width *= 2
+    return dummy.next, tail
+
+"""
+Records a node under its value in a hash index.
+@return None
+Complexity: T:O(1) average S:O(1)
+"""
+def indexAdd(valueIndex, node)->None:
+    nodes = valueIndex.getItem(node.value)
+    if nodes is None:
+        valueIndex.setItem(node.value, [node])
+    else:
+        nodes.append(node)
+
+"""
+Drops a node from a hash index. A node the index does not hold under its value
+(e.g. after node.value was assigned directly) is ignored.
+@return None
+Complexity: T:O(d) S:O(1), d = duplicates of the value
+"""
+def indexRemove(valueIndex, node)->None:
+    nodes = valueIndex.getItem(node.value)
+    if nodes is None:
+        return
+    if len(nodes) == 1:
+        if nodes[0] is node:
+            valueIndex.remove(node.value)
+        return
+    try:
+        nodes.remove(node)
+    except ValueError:
+        pass
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+NodePool Class
+@author Avinash Rai
+
+Bounded free list of detached Node objects.
+Stack, Queue and LinkedList accept an optional pool: new nodes are taken from it,
+and the value-returning removals (popValue, dequeueValue, popFirstValue) give the
+node back instead of dropping it. Node-returning methods (pop, dequeue, ...) hand
+the node to the caller, so those nodes are never recycled.
+One pool can be shared by several containers.
+
+Methods overview:
+    - acquire(value)
+    - release(node)
+    - size()
+    - maxSize()
+    - clear()
+"""
+from datastructures.Node import Node
+
+class NodePool:
+    """
+    Create an instance of NodePool class
+        maxSize Max number of idle nodes kept, extra released nodes are dropped
+    Private Members:-
+        - free Python List used as a stack of idle nodes
+        - maxSize bound of free
+    """
+    def __init__(self, maxSize:int=1024)->None:
+        if maxSize < 0:
+            raise ValueError("maxSize must not be negative")
+        self.__free = []
+        self.__maxSize = maxSize
+
+    """
+    Returns an idle node holding value, or a new Node if the pool is empty.
+    @return Node
+    Complexity: O(1)
+    """
+    def acquire(self, value:any)->Node:
+        if self.__free:
+            node = self.__free.pop()
+            node.value = value
+            return node
+        return Node(value)
+
+    """
+    Takes back a detached node. Its value and next pointer are cleared so the
+    pool does not keep anything alive.
+    @return Boolean - False if the pool is full and the node was dropped
+    Complexity: O(1)
+    """
+    def release(self, node:Node)->bool:
+        node.value = None
+        node.next = None
+        if len(self.__free) < self.__maxSize:
+            self.__free.append(node)
+            return True
+        return False
+
+    """
+    Number of idle nodes
+    @return int
+    Complexity: O(1)
+    """
+    def size(self)->int:
+        return len(self.__free)
+
+    """
+    Max number of idle nodes
+    @return int
+    Complexity: O(1)
+    """
+    def maxSize(self)->int:
+        return self.__maxSize
+
+    """
+    Drops every idle node
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        self.__free = []
\ No newline at end of file
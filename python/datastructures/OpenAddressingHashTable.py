@@ -0,0 +1,292 @@
+"""
+OpenAddressingHashTable Class
+@author Avinash Rai
+
+Uses "Open Addressing" with Linear Probing for Collision Handling.
+Same API as HashTable, but entries live in three flat parallel arrays instead of a
+Python list per bucket and a [key, value] list per entry:
+    - keys   Python List of key references
+    - values Python List of value references
+    - hashes array('q') of the full cached hash of each key, so probes compare
+             ints before keys and resizes never call hash() again. A hashFunction
+             result outside the signed 64-bit range is folded into it first
+             (same low bits, so the same slot)
+Removed slots are marked with a tombstone so probe chains stay intact. Tombstones
+count towards the load factor and are dropped by the next rebuild.
+Capacity is always a power of two so the slot index is a bit mask.
+Hashing is pluggable like HashTable (builtin hash() by default).
+
+Methods overview:
+    - setItem(key,value)
+    - getItem(key)
+    - keys()
+    - remove(key)
+    - keyExists(key)
+    - print()
+    - capacity()
+    - numItems()
+    - isEmpty()
+    - resize(size)
+    - clear()
+"""
+from array import array
+
+_EMPTY = object()
+_DELETED = object()
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+"""
+Folds an int of any size into the signed 64-bit range kept by array('q').
+@return int
+Complexity: O(1)
+"""
+def _toInt64(keyHash):
+    keyHash &= 0xFFFFFFFFFFFFFFFF
+    if keyHash > _INT64_MAX:
+        keyHash -= 1 << 64
+    return keyHash
+
+class OpenAddressingHashTable:
+    """
+    Creates a hash table using open addressing over flat parallel arrays.
+    Private Members:-
+        - keys, values, hashes Parallel slot arrays
+        - mask capacity - 1, maps a hash to a slot
+        - used No of slots holding a key or a tombstone
+        - numItems No of live items manually tracked to keep O(1) complexity
+        - initialSize Capacity the table never shrinks below
+        - loadFactor Max ratio of used slots to capacity before a rebuild
+        - hashFunction Callable key -> int used to hash keys. Default builtin hash()
+    """
+    def __init__(self, size=8, loadFactor=0.7, hashFunction=hash):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if not 0 < loadFactor < 1:
+            raise ValueError("loadFactor must be between 0 and 1")
+        self.__loadFactor = loadFactor
+        self.__hashFunction = hashFunction
+        self.__initialSize = self.__roundUp(size)
+        self.__numItems = 0
+        self.__allocate(self.__initialSize)
+
+    """
+    Private method - Smallest power of two >= size (minimum 8).
+    @return int
+    Complexity: O(log n)
+    """
+    def __roundUp(self, size):
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+        return capacity
+
+    """
+    Private method - Replaces the slot arrays with empty ones of the given capacity.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def __allocate(self, capacity):
+        self.__keys = [_EMPTY] * capacity
+        self.__values = [None] * capacity
+        self.__hashes = array('q', bytes(8 * capacity))
+        self.__mask = capacity - 1
+        self.__used = 0
+
+    """
+    Private method - Returns the slot holding the key or -1.
+    @return int
+    Complexity: T:O(1) average S:O(1)
+    """
+    def __find(self, key):
+        keyHash = self.__hashFunction(key)
+        if not _INT64_MIN <= keyHash <= _INT64_MAX:
+            keyHash = _toInt64(keyHash)
+        keys = self.__keys
+        hashes = self.__hashes
+        mask = self.__mask
+        i = keyHash & mask
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _DELETED and hashes[i] == keyHash and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    """
+    Private method - Rebuilds the slot arrays at a new capacity, dropping tombstones.
+        Cached hashes are reused, no key is hashed again.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def __rebuild(self, capacity):
+        oldKeys, oldValues, oldHashes = self.__keys, self.__values, self.__hashes
+        self.__allocate(capacity)
+        keys, values, hashes, mask = self.__keys, self.__values, self.__hashes, self.__mask
+        for j in range(len(oldKeys)):
+            k = oldKeys[j]
+            if k is _EMPTY or k is _DELETED:
+                continue
+            keyHash = oldHashes[j]
+            i = keyHash & mask
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i] = k
+            values[i] = oldValues[j]
+            hashes[i] = keyHash
+        self.__used = self.__numItems
+
+    """
+    Private method - Capacity that keeps numItems at 2/3 of the load factor.
+        Doubles a full table, but only purges tombstones in place when they were
+        the reason the load factor was exceeded.
+    @return int
+    Complexity: O(log n)
+    """
+    def __targetCapacity(self):
+        return max(self.__roundUp(self.__numItems * 1.5 / self.__loadFactor), self.__initialSize)
+
+    """
+    Inserts or updates a key-value pair in the hash table.
+    @return Bool
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def setItem(self, key:any, value:any) -> bool:
+        if value is None:
+            return False
+
+        keyHash = self.__hashFunction(key)
+        if not _INT64_MIN <= keyHash <= _INT64_MAX:
+            keyHash = _toInt64(keyHash)
+        keys = self.__keys
+        hashes = self.__hashes
+        mask = self.__mask
+        i = keyHash & mask
+        tombstone = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == keyHash and (k is key or k == key):
+                self.__values[i] = value
+                return True
+            i = (i + 1) & mask
+
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self.__used += 1
+        keys[i] = key
+        self.__values[i] = value
+        hashes[i] = keyHash
+        self.__numItems += 1
+
+        if self.__used > (mask + 1) * self.__loadFactor:
+            self.__rebuild(self.__targetCapacity())
+        return True
+
+    """
+    Retrieves the value for a given key.
+    @return any
+    Complexity: T:O(1) average S:O(1)
+    """
+    def getItem(self, key:any)->any:
+        i = self.__find(key)
+        if i < 0:
+            return None
+        return self.__values[i]
+
+    """
+    Returns a list of all keys in the hash table.
+    @return List
+    Complexity: O(n)
+    """
+    def keys(self)->list:
+        return [k for k in self.__keys if k is not _EMPTY and k is not _DELETED]
+
+    """
+    Removes the key-value pair if the key exists, leaving a tombstone.
+    @return Bool
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def remove(self, key:any)->bool:
+        i = self.__find(key)
+        if i < 0:
+            return False
+        self.__keys[i] = _DELETED
+        self.__values[i] = None
+        self.__numItems -= 1
+
+        capacity = self.__mask + 1
+        if capacity > self.__initialSize and self.__numItems < capacity * self.__loadFactor / 8:
+            self.__rebuild(max(capacity // 4, self.__initialSize))
+        return True
+
+    """
+    Check if a key exists in the HashTable
+    @return bool
+    Complexity: T:O(1) average S:O(1)
+    """
+    def keyExists(self, key:any)->bool:
+        return self.__find(key) >= 0
+
+    """
+    Prints the contents of the hash table (slot index and entry)
+    Complexity: T:O(n) S:O(1)
+    """
+    def print(self)->None:
+        for i, k in enumerate(self.__keys):
+            if k is _EMPTY:
+                print(i, ": ", None)
+            elif k is _DELETED:
+                print(i, ": ", "<deleted>")
+            else:
+                print(i, ": ", [k, self.__values[i]])
+
+    """
+    Current Capacity (number of slots) of the Hash Table
+    @return int
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return self.__mask + 1
+
+    """
+    Returns the number of key-value pairs stored in the hash table.
+    @return int
+    Complexity: O(1)
+    """
+    def numItems(self)->int:
+        return self.__numItems
+
+    """
+    Checks if the Hash Table is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        return self.__numItems == 0
+
+    """
+    Rebuilds the table with at least the given number of slots.
+        Rounded up to a power of two and never below what the current items need.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def resize(self, size:int=None)->None:
+        if size is None:
+            size = self.capacity() * 2
+        self.__rebuild(max(self.__roundUp(size), self.__roundUp(self.__numItems / self.__loadFactor)))
+
+    """
+    Clears all items and returns the table to its initial capacity
+    @return None
+    Complexity: T:O(n) S:O(1)
+    """
+    def clear(self)->None:
+        self.__allocate(self.__initialSize)
+        self.__numItems = 0
\ No newline at end of file
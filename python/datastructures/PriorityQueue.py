@@ -0,0 +1,248 @@
+"""
+PriorityQueue Class
+@author Avinash Rai
+
+Min-priority queue on an array-backed d-ary heap (binary by default).
+The entry with the smallest priority is served first; entries with equal priorities
+come out in no particular order (use (priority, sequence) tuples for FIFO ties).
+push() returns the HeapNode holding the entry. The node keeps its own index in the
+heap array, so decreaseKey() and remove() find it in O(1) instead of searching.
+A larger arity gives a shallower tree: fewer moves per push and decreaseKey, more
+comparisons per pop.
+
+Methods overview:
+    - push(priority, value)
+    - pop()
+    - peek()
+    - heapify(iterable)
+    - decreaseKey(node, priority)
+    - remove(node)
+    - contains(node)
+    - length()
+    - arity()
+    - isEmpty()
+    - clear()
+    - PriorityQueue.fromIterable(iterable, arity)
+    - len(queue)
+"""
+from datastructures.HeapNode import HeapNode
+
+class PriorityQueue:
+    """
+    Create an instance of PriorityQueue class
+        arity Number of children per heap node, at least 2
+    Private Members:-
+        - heap Python list of HeapNode, heap[0] has the smallest priority
+        - arity children per node; the children of i are arity * i + 1 ... arity * i + arity
+    """
+    def __init__(self, arity:int=2)->None:
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.__heap = []
+        self.__arity = arity
+
+    """
+    Private method - Moves the node at position up until its parent is not larger.
+    @return None
+    Complexity: T:O(log n) S:O(1)
+    """
+    def __siftUp(self, position):
+        heap = self.__heap
+        arity = self.__arity
+        node = heap[position]
+        priority = node.priority
+        while position > 0:
+            parentPosition = (position - 1) // arity
+            parent = heap[parentPosition]
+            if not priority < parent.priority:
+                break
+            heap[position] = parent
+            parent.position = position
+            position = parentPosition
+        heap[position] = node
+        node.position = position
+
+    """
+    Private method - Moves the node at position down until no child is smaller.
+    @return None
+    Complexity: T:O(arity * log n) S:O(1)
+    """
+    def __siftDown(self, position):
+        heap = self.__heap
+        arity = self.__arity
+        length = len(heap)
+        node = heap[position]
+        priority = node.priority
+        while True:
+            first = arity * position + 1
+            if first >= length:
+                break
+            child = heap[first]
+            best = first
+            if arity == 2:
+                if first + 1 < length and heap[first + 1].priority < child.priority:
+                    best = first + 1
+                    child = heap[best]
+            else:
+                for other in range(first + 1, min(first + arity, length)):
+                    if heap[other].priority < child.priority:
+                        best = other
+                        child = heap[other]
+            if not child.priority < priority:
+                break
+            heap[position] = child
+            child.position = position
+            position = best
+        heap[position] = node
+        node.position = position
+
+    """
+    Adds a value with a priority.
+    @return HeapNode - handle for decreaseKey() and remove()
+    Complexity: T:O(log n) S:O(1)
+    """
+    def push(self, priority:any, value:any=None)->HeapNode:
+        node = HeapNode(priority, value)
+        self.__heap.append(node)
+        self.__siftUp(len(self.__heap) - 1)
+        return node
+
+    """
+    Removes the node with the smallest priority and return it.
+    @return HeapNode/None
+    Complexity: T:O(log n) S:O(1)
+    """
+    def pop(self)->HeapNode:
+        heap = self.__heap
+        if not heap:
+            return None
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.__siftDown(0)
+        top.position = -1
+        return top
+
+    """
+    View the value with the smallest priority without removing it.
+    @return any/None
+    Complexity: O(1)
+    """
+    def peek(self)->any:
+        if self.__heap:
+            return self.__heap[0].value
+        return None
+
+    """
+    Adds every (priority, value) pair of an iterable, then restores the heap bottom-up.
+    @return list - the new HeapNodes, in input order
+    Complexity: T:O(n + k) S:O(k), where k = number of new pairs
+    """
+    def heapify(self, iterable)->list:
+        heap = self.__heap
+        nodes = []
+        for priority, value in iterable:
+            node = HeapNode(priority, value)
+            node.position = len(heap)
+            heap.append(node)
+            nodes.append(node)
+        for position in range((len(heap) - 2) // self.__arity, -1, -1):
+            self.__siftDown(position)
+        return nodes
+
+    """
+    Builds a priority queue from an iterable of (priority, value) pairs.
+    @return PriorityQueue
+    Complexity: T:O(n) S:O(n)
+    """
+    @classmethod
+    def fromIterable(cls, iterable, arity:int=2)->"PriorityQueue":
+        newQueue = cls(arity)
+        newQueue.heapify(iterable)
+        return newQueue
+
+    """
+    Lowers the priority of a node still in this queue.
+    @return Boolean - False if the node is not in the queue or priority is larger
+    Complexity: T:O(log n) S:O(1)
+    """
+    def decreaseKey(self, node:HeapNode, priority:any)->bool:
+        if not self.contains(node) or node.priority < priority:
+            return False
+        node.priority = priority
+        self.__siftUp(node.position)
+        return True
+
+    """
+    Removes a node from anywhere in the queue.
+    @return Boolean - False if the node is not in the queue
+    Complexity: T:O(log n) S:O(1)
+    """
+    def remove(self, node:HeapNode)->bool:
+        if not self.contains(node):
+            return False
+        heap = self.__heap
+        position = node.position
+        last = heap.pop()
+        if last is not node:
+            heap[position] = last
+            last.position = position
+            self.__siftUp(position)
+            if last.position == position:
+                self.__siftDown(position)
+        node.position = -1
+        return True
+
+    """
+    Checks if a node is in this queue.
+    @return Boolean
+    Complexity: O(1)
+    """
+    def contains(self, node:HeapNode)->bool:
+        position = node.position
+        return 0 <= position < len(self.__heap) and self.__heap[position] is node
+
+    """
+    Returns the number of values in the queue.
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        return len(self.__heap)
+
+    """
+    Returns the number of children per heap node.
+    @return int
+    Complexity: O(1)
+    """
+    def arity(self)->int:
+        return self.__arity
+
+    """
+    Checks if the queue is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        if self.__heap:
+            return False
+        return True
+
+    """
+    Clears all values. The removed nodes are marked as out of the queue.
+    @return None
+    Complexity: T:O(n) S:O(1)
+    """
+    def clear(self)->None:
+        for node in self.__heap:
+            node.position = -1
+        self.__heap = []
+
+    """
+    Length of the queue, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return len(self.__heap)
\ No newline at end of file
@@ -3,11 +3,13 @@ Queue Class
 @author Avinash Rai
 
 FIFO (Last in First Out)
+Optional NodePool: nodes removed with dequeueValue() are recycled by later enqueues.
 
 Methods overview:
     - enqueue(value)
     - front()
     - dequeue()
+    - dequeueValue()
     - contains(value)
     - print()
     - length()
@@ -15,20 +17,24 @@ Methods overview:
     - clear()
 """
 from datastructures.Node import Node
+from datastructures.NodePool import NodePool
 
 class Queue:
     """
     Create an instance of Queue class
         Initialize with a value or create an empty queue.
+        pool Optional NodePool to take new nodes from and give dequeued nodes back to
     
     Private Members:
         - __first (Node): Points to the front of the queue
         - __last (Node): Points to the rear of the queue
         - __length (int): Number of elements in the queue
+        - __pool (NodePool): Node free list or None
     """
-    def __init__(self, value=None)->None:
+    def __init__(self, value=None, pool:NodePool=None)->None:
+        self.__pool = pool
         if value:
-            newNode = Node(value)
+            newNode = pool.acquire(value) if pool is not None else Node(value)
             self.__first = newNode
             self.__last = newNode
             self.__length = 1
@@ -43,7 +49,10 @@ class Queue:
     Complexity: O(1)
     """
     def enqueue(self, value:any)->bool:
-        newNode = Node(value)
+        if self.__pool is not None:
+            newNode = self.__pool.acquire(value)
+        else:
+            newNode = Node(value)
         if self.__length == 0:
             self.__first = newNode
             self.__last = newNode
@@ -80,6 +89,25 @@ class Queue:
         temp.next = None
         self.__length -= 1
         return temp
+
+    """
+    Removes the front node from the queue and returns its value.
+        The node never leaves the queue, so it goes back to the pool if there is one.
+    @return any/None
+    Complexity: O(1)
+    """
+    def dequeueValue(self)->any:
+        if self.__length == 0:
+            return None
+        temp = self.__first
+        self.__first = temp.next
+        if self.__first is None:
+            self.__last = None
+        self.__length -= 1
+        value = temp.value
+        if self.__pool is not None:
+            self.__pool.release(temp)
+        return value
     
     """
     Check if the queue contains a given value.
@@ -0,0 +1,203 @@
+"""
+RingBufferQueue Class
+@author Avinash Rai
+
+FIFO (First in First Out) over a circular Python list instead of linked Nodes.
+The buffer is preallocated and its capacity is always a power of two, so the slot
+of the i-th element is (head + i) & (capacity - 1). When it is full the buffer
+doubles; when it falls to a quarter full it halves, never below the initial capacity.
+enqueue allocates nothing until the buffer grows, and dequeue returns the VALUE.
+
+Methods overview:
+    - enqueue(value)
+    - enqueueFront(value)
+    - front()
+    - dequeue()
+    - contains(value)
+    - print()
+    - length()
+    - capacity()
+    - isEmpty()
+    - clear()
+    - len(queue), for value in queue
+"""
+
+class RingBufferQueue:
+    """
+    Create an instance of RingBufferQueue class
+        Initialize with a value or create an empty queue.
+        capacity Initial and minimum number of slots, rounded up to a power of two
+
+    Private Members:
+        - __buffer (list): Slots, None when unused
+        - __head (int): Slot of the front of the queue
+        - __tail (int): Slot the next enqueued value goes to
+        - __length (int): Number of elements in the queue
+        - __mask (int): capacity - 1, turns a position into a slot
+        - __shrinkAt (int): Length at which the buffer halves, -1 at the minimum capacity
+        - __minCapacity (int): The buffer never shrinks below this
+    """
+    def __init__(self, value=None, capacity:int=8)->None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.__minCapacity = size
+        self.clear()
+        if value:
+            self.enqueue(value)
+
+    """
+    Private method - Moves the elements to a new buffer of a given size, front first.
+    @return None
+    Complexity: T:O(n) S:O(n)
+    """
+    def __resize(self, size):
+        buffer = self.__buffer
+        head = self.__head
+        end = head + self.__length
+        if end <= len(buffer):
+            values = buffer[head:end]
+        else:
+            values = buffer[head:] + buffer[:end - len(buffer)]
+        values.extend([None] * (size - self.__length))
+        self.__buffer = values
+        self.__head = 0
+        self.__tail = self.__length & (size - 1)
+        self.__mask = size - 1
+        self.__shrinkAt = size // 4 if size > self.__minCapacity else -1
+
+    """
+    Adds a value to the rear of the queue.
+    @return Boolean - True when successful.
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def enqueue(self, value:any)->bool:
+        tail = self.__tail
+        self.__buffer[tail] = value
+        self.__tail = (tail + 1) & self.__mask
+        self.__length += 1
+        if self.__length > self.__mask:
+            self.__resize(2 * (self.__mask + 1))
+        return True
+
+    """
+    Adds a value to the front of the queue, ahead of every other value.
+    @return Boolean - True when successful.
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def enqueueFront(self, value:any)->bool:
+        head = (self.__head - 1) & self.__mask
+        self.__buffer[head] = value
+        self.__head = head
+        self.__length += 1
+        if self.__length > self.__mask:
+            self.__resize(2 * (self.__mask + 1))
+        return True
+
+    """
+    View the first value of the queue without removing it.
+    @return any
+    Complexity: O(1)
+    """
+    def front(self)->any:
+        if self.__length > 0:
+            return self.__buffer[self.__head]
+        return None
+
+    """
+    Removes the front value from the queue and returns it.
+    @return any/None
+    Complexity: T:O(1) amortized S:O(1)
+    """
+    def dequeue(self)->any:
+        if self.__length == 0:
+            return None
+        head = self.__head
+        buffer = self.__buffer
+        value = buffer[head]
+        buffer[head] = None
+        self.__head = (head + 1) & self.__mask
+        self.__length -= 1
+        if self.__length <= self.__shrinkAt:
+            self.__resize((self.__mask + 1) // 2)
+        return value
+
+    """
+    Check if the queue contains a given value.
+    @return Boolean - True if found
+    Complexity: T:O(n) S:O(1)
+    """
+    def contains(self, value:any)->bool:
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    """
+    Prints the queue from front to rear.
+    @return None
+    Complexity: T:O(n) S:O(1)
+    """
+    def print(self)->None:
+        for value in self:
+            print(value)
+
+    """
+    Returns the number of elements in the queue.
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        return self.__length
+
+    """
+    Returns the number of slots in the buffer.
+    @return int
+    Complexity: O(1)
+    """
+    def capacity(self)->int:
+        return len(self.__buffer)
+
+    """
+    Checks if the queue is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        if self.__length > 0:
+            return False
+        return True
+
+    """
+    Clears all elements in the queue and shrinks the buffer back to its initial capacity.
+    @return None
+    Complexity: O(1)
+    """
+    def clear(self)->None:
+        self.__buffer = [None] * self.__minCapacity
+        self.__head = 0
+        self.__tail = 0
+        self.__length = 0
+        self.__mask = self.__minCapacity - 1
+        self.__shrinkAt = -1
+
+    """
+    Supports "for value in queue", front to rear.
+    @return Iterator of values
+    Complexity: T:O(n) S:O(1)
+    """
+    def __iter__(self):
+        buffer = self.__buffer
+        mask = self.__mask
+        for i in range(self.__head, self.__head + self.__length):
+            yield buffer[i & mask]
+
+    """
+    Length of the queue, same as length().
+    @return int
+    Complexity: O(1)
+    """
+    def __len__(self)->int:
+        return self.__length
\ No newline at end of file
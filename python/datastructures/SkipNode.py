@@ -0,0 +1,19 @@
+"""
+SkipNode Class
+@author Avinash Rai
+
+TwoPointerNode with a skip-list tower, used by the indexed mode of DoublyLinkedList.
+links[i] points to the next SkipNode on level i + 1 and widths[i] is the number of
+level-0 steps that link spans. A tower of height h has h - 1 entries; level 0 is
+the ordinary next pointer.
+Adds links and widths to the slots inherited from TwoPointerNode.
+"""
+from datastructures.TwoPointerNode import TwoPointerNode
+
+class SkipNode(TwoPointerNode):
+    __slots__ = ("links", "widths")
+
+    def __init__(self, value:any, height:int=1)->None:
+        super().__init__(value)
+        self.links = [None] * (height - 1)
+        self.widths = [0] * (height - 1)
\ No newline at end of file
@@ -4,30 +4,36 @@ Stack Class
 
 LIFO (Last in First Out)
 Unlimited size Stack
+Optional NodePool: nodes removed with popValue() are recycled by later pushes.
 
 Methods overview:
     - push(value)
     - peek()
     - pop()
+    - popValue()
     - print()
     - size()
     - isEmpty()
     - clear()
 """
 from datastructures.Node import Node
+from datastructures.NodePool import NodePool
 
 class Stack:
     """
     Create an instance of Stack class
         Initialize with a value or create an empty stack.
+        pool Optional NodePool to take new nodes from and give popped nodes back to
     
     Private Members:-
         - top (Node): Pointer to the top of the stack
         - size (int): Keeps track of the number of elements
+        - pool (NodePool): Node free list or None
     """
-    def __init__(self, value=None)->None:
+    def __init__(self, value=None, pool:NodePool=None)->None:
+        self.__pool = pool
         if value:
-            newNode = Node(value)
+            newNode = pool.acquire(value) if pool is not None else Node(value)
             self.__top = newNode
             self.__size = 1
         else:
@@ -40,7 +46,10 @@ class Stack:
     Complexity: O(1)    
     """
     def push(self, value:any)->bool:
-        newNode = Node(value)
+        if self.__pool is not None:
+            newNode = self.__pool.acquire(value)
+        else:
+            newNode = Node(value)
         newNode.next = self.__top
         self.__top = newNode        
         self.__size += 1
@@ -70,6 +79,23 @@ class Stack:
         self.__size -= 1
         return temp
 
+    """
+    Removes the top node from the stack and returns its value.
+        The node never leaves the stack, so it goes back to the pool if there is one.
+    @return any/None
+    Complexity: O(1)
+    """
+    def popValue(self)->any:
+        if self.__size == 0:
+            return None
+        temp = self.__top
+        self.__top = temp.next
+        self.__size -= 1
+        value = temp.value
+        if self.__pool is not None:
+            self.__pool.release(temp)
+        return value
+
     """
     Print the contents of the stack from top to bottom.
     @return None
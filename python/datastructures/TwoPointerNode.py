@@ -3,8 +3,12 @@ TwoPointerNode Class
 @author Avinash Rai
 
 Contains both reference to PREVIOUS and NEXT pointers.
+Declares its three fields in __slots__ like Node, so the extra PREVIOUS pointer
+costs one slot, not a bigger __dict__.
 """
 class TwoPointerNode:
+    __slots__ = ("value", "previous", "next")
+
     def __init__(self:object, value:any)->None:
         self.value = value
         self.previous = None
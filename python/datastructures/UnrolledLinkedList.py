@@ -0,0 +1,300 @@
+"""
+UnrolledLinkedList Class
+@author Avinash Rai
+
+Linked List where each node (ArrayNode) stores up to nodeCapacity values in a
+Python list instead of one value per Node. Far fewer node objects are allocated,
+and walks skip a whole node at a time by its length (n / nodeCapacity hops)
+while the values inside a node sit next to each other.
+    - A full node is split in half on insert.
+    - A node that drops below half full after a removal borrows from, or merges
+      with, its next node. Only the tail node may stay less than half full.
+Same API as LinkedList, but there are no per-element nodes to hand out:
+pop, popFirst, removeByIndex, removeByValue and getByIndex return the VALUE,
+and find returns the INDEX.
+
+Methods overview:
+    - append(value)
+    - prepend(value)
+    - insert(index, value)
+    - pop()
+    - popFirst()
+    - removeByIndex(index)
+    - removeByValue(value)
+    - getByIndex(index)
+    - setByIndex(index, value)
+    - find(value)
+    - print()
+    - length()
+    - isEmpty()
+    - reverse()
+"""
+from datastructures.ArrayNode import ArrayNode
+
+class UnrolledLinkedList:
+    """
+    Create an instance of Unrolled Linked List class
+        Initialize with a value or empty list
+    Private Members:-
+        - head pointer
+        - tail pointer
+        - length counter (number of values, not nodes)
+        - nodeCapacity Max values per node
+    """
+    def __init__(self, value=None, nodeCapacity:int=64)->None:
+        if nodeCapacity < 2:
+            raise ValueError("nodeCapacity must be at least 2")
+        self.__nodeCapacity = nodeCapacity
+        self.__head = None
+        self.__tail = None
+        self.__length = 0
+        if value is not None:
+            self.append(value)
+
+    """
+    Private method - Finds the node holding a given index.
+    @return Tuple - (previous node, node, offset inside node)
+    Complexity: T:O(n / nodeCapacity) S:O(1)
+    """
+    def __locate(self, index):
+        prev = None
+        node = self.__head
+        while index >= len(node.values):
+            index -= len(node.values)
+            prev = node
+            node = node.next
+        return prev, node, index
+
+    """
+    Private method - Restores the half-full invariant of a node after a removal.
+        Empty nodes are unlinked; a node under half full merges with its next
+        node when both fit in one node, otherwise borrows values from it.
+    @return None
+    Complexity: T:O(nodeCapacity) S:O(1)
+    """
+    def __rebalance(self, prev, node):
+        if not node.values:
+            if prev is None:
+                self.__head = node.next
+            else:
+                prev.next = node.next
+            if node is self.__tail:
+                self.__tail = prev
+            node.next = None
+            return
+
+        after = node.next
+        if after is None or len(node.values) >= self.__nodeCapacity // 2:
+            return
+        if len(node.values) + len(after.values) <= self.__nodeCapacity:
+            node.values.extend(after.values)
+            node.next = after.next
+            if after is self.__tail:
+                self.__tail = node
+            after.next = None
+        else:
+            borrow = (len(after.values) - len(node.values)) // 2
+            node.values.extend(after.values[:borrow])
+            del after.values[:borrow]
+
+    """
+    Adds a value at the end of the list.
+    @return Boolean
+    Complexity: T:O(1) S:O(1)
+    """
+    def append(self, value:any)->bool:
+        if self.__tail is None:
+            self.__head = self.__tail = ArrayNode([value])
+        elif len(self.__tail.values) < self.__nodeCapacity:
+            self.__tail.values.append(value)
+        else:
+            newNode = ArrayNode([value])
+            self.__tail.next = newNode
+            self.__tail = newNode
+        self.__length += 1
+        return True
+
+    """
+    Add a value at the beginning of the list, same as insert(0, value).
+        A full head node is split in half first, so it never leaves a small node
+        in front of the list.
+    @return Boolean
+    Complexity: T:O(nodeCapacity) S:O(1)
+    """
+    def prepend(self, value:any)->bool:
+        return self.insert(0, value)
+
+    """
+    Inserts a value so that it ends up at the given index (0 <= index <= length).
+        A full node is split in half first.
+    @return Boolean - False if the index is out of range
+    Complexity: T:O(n / nodeCapacity + nodeCapacity) S:O(1)
+    """
+    def insert(self, index:int, value:any)->bool:
+        if index < 0 or index > self.__length:
+            return False
+        if index == self.__length:
+            return self.append(value)
+        _, node, offset = self.__locate(index)
+        if len(node.values) >= self.__nodeCapacity:
+            half = len(node.values) // 2
+            newNode = ArrayNode(node.values[half:])
+            del node.values[half:]
+            newNode.next = node.next
+            node.next = newNode
+            if node is self.__tail:
+                self.__tail = newNode
+            if offset > half:
+                node = newNode
+                offset -= half
+        node.values.insert(offset, value)
+        self.__length += 1
+        return True
+
+    """
+    Removes the last value from the list and return it.
+    @return any/None
+    Complexity: T:O(n / nodeCapacity) S:O(1)
+    """
+    def pop(self)->any:
+        if self.__length == 0:
+            return None
+        return self.removeByIndex(self.__length - 1)
+
+    """
+    Removes the first value and return it.
+    @return any/None
+    Complexity: T:O(nodeCapacity) S:O(1)
+    """
+    def popFirst(self)->any:
+        if self.__length == 0:
+            return None
+        value = self.__head.values.pop(0)
+        self.__length -= 1
+        self.__rebalance(None, self.__head)
+        return value
+
+    """
+    Removes the value at a specific position and return it.
+    @return any/None
+    Complexity: T:O(n / nodeCapacity + nodeCapacity) S:O(1)
+    """
+    def removeByIndex(self, index:int)->any:
+        if index < 0 or index >= self.__length:
+            return None
+        prev, node, offset = self.__locate(index)
+        value = node.values.pop(offset)
+        self.__length -= 1
+        self.__rebalance(prev, node)
+        return value
+
+    """
+    Search for a value and remove the first occurrence.
+    @return any/None - the removed value
+    Complexity: T:O(n) S:O(1)
+    """
+    def removeByValue(self, value:any)->any:
+        prev = None
+        node = self.__head
+        while node is not None:
+            if value in node.values:
+                node.values.remove(value)
+                self.__length -= 1
+                self.__rebalance(prev, node)
+                return value
+            prev = node
+            node = node.next
+        return None
+
+    """
+    Returns the value at a given index.
+    @return any/None
+    Complexity: T:O(n / nodeCapacity) S:O(1)
+    """
+    def getByIndex(self, index:int)->any:
+        if index < 0 or index >= self.__length:
+            return None
+        if index >= self.__length - len(self.__tail.values):
+            return self.__tail.values[index - self.__length + len(self.__tail.values)]
+        _, node, offset = self.__locate(index)
+        return node.values[offset]
+
+    """
+    Updates the value at a specific index.
+    @return bool - True if updated
+    Complexity: T:O(n / nodeCapacity) S:O(1)
+    """
+    def setByIndex(self, index:int, value:any)->bool:
+        if index < 0 or index >= self.__length:
+            return False
+        _, node, offset = self.__locate(index)
+        node.values[offset] = value
+        return True
+
+    """
+    Returns the index of the first occurrence of the given value.
+        Each node is searched with list.index, in C.
+    @return int/None
+    Complexity: T:O(n) S:O(1)
+    """
+    def find(self, value:any)->int:
+        base = 0
+        node = self.__head
+        while node is not None:
+            if value in node.values:
+                return base + node.values.index(value)
+            base += len(node.values)
+            node = node.next
+        return None
+
+    """
+    Print all items in the list
+    Complexity: T:O(n) S:O(1)
+    """
+    def print(self)->None:
+        node = self.__head
+        while node is not None:
+            for value in node.values:
+                print(value)
+            node = node.next
+
+    """
+    Length/size of the list (number of values)
+    @return int
+    Complexity: O(1)
+    """
+    def length(self)->int:
+        return self.__length
+
+    """
+    Checks if the list is empty.
+    @return boolean
+    Complexity: O(1)
+    """
+    def isEmpty(self)->bool:
+        if self.__length > 0:
+            return False
+        return True
+
+    """
+    Reverses the list: node order is reversed and each node's values in place.
+        The old tail, the one node allowed to be under half full, becomes the head
+        and is rebalanced with its next node.
+    @return Boolean - True if operation completed
+    Complexity: T:O(n) S:O(1)
+    """
+    def reverse(self)->bool:
+        if self.__length == 0:
+            return False
+
+        node = self.__head
+        self.__head, self.__tail = self.__tail, self.__head
+        before = None
+        while node is not None:
+            after = node.next
+            node.next = before
+            node.values.reverse()
+            before = node
+            node = after
+        self.__rebalance(None, self.__head)
+        return True
\ No newline at end of file